@@ -8,3 +8,13 @@ data analysis.
 __version__ = "0.1.0"
 __author__ = "CokieMiner"
 __license__ = "GPL v3"
+
+
+def get_version() -> str:
+    """
+    Get the application version.
+
+    Returns:
+        Version string
+    """
+    return __version__
@@ -10,58 +10,71 @@ import argparse
 from pathlib import Path
 
 import logging
+from typing import Any
 
-from anafis import __version__
-from anafis.gui.gui import create_gui_application, run_application
+from anafis import get_version
 
 # Import core functionality
-from anafis.core.logging_config import setup_application_logging
+from anafis.core.logging_config import APP_LOG_DIR, setup_application_logging
 from anafis.core.config import get_user_config, validate_config, reset_to_defaults
 from anafis.core.data_structures import ApplicationConfig
 
 
-def parse_arguments() -> argparse.Namespace:
-    """
-    Parse command line arguments.
+_DESCRIPTION = "ANAFIS - Advanced Numerical Analysis and Fitting Interface System"
 
-    Returns:
-        Parsed command line arguments
-    """
-    parser = argparse.ArgumentParser(
-        description=("ANAFIS - Advanced Numerical Analysis and Fitting " "Interface System"),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   anafis                    # Start with default settings
   anafis --debug           # Start with debug logging
   anafis --config-dir /path # Use custom config directory
   anafis --reset-config    # Reset to default configuration
-        """,
-    )
+        """
 
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+_FORMATTER = argparse.RawDescriptionHelpFormatter
 
-    parser.add_argument("--config-dir", type=Path, help="Custom configuration directory")
+# Argument definitions as (flags, add_argument kwargs)
+_ArgumentSpec = tuple[tuple[str, ...], dict[str, Any]]
 
-    parser.add_argument("--log-dir", type=Path, help="Custom log directory")
+_ARGUMENT_SPECS: tuple[_ArgumentSpec, ...] = (
+    (("--debug",), {"action": "store_true", "help": "Enable debug logging"}),
+    (("--config-dir",), {"type": Path, "help": "Custom configuration directory"}),
+    (("--log-dir",), {"type": Path, "help": "Custom log directory"}),
+    (("--reset-config",), {"action": "store_true", "help": "Reset configuration to defaults"}),
+    (("--no-gui",), {"action": "store_true", "help": "Run without GUI (for testing/debugging)"}),
+)
 
-    parser.add_argument("--reset-config", action="store_true", help="Reset configuration to defaults")
 
-    parser.add_argument("--no-gui", action="store_true", help="Run without GUI (for testing/debugging)")
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
 
+    Returns:
+        Parsed command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=_FORMATTER,
+        epilog=_EPILOG,
+    )
+    for flags, options in _ARGUMENT_SPECS:
+        parser.add_argument(*flags, **options)
     parser.add_argument("--version", action="version", version=f"ANAFIS {get_version()}")
 
     return parser.parse_args()
 
 
-def get_version() -> str:
+def enable_pandas_copy_on_write() -> None:
     """
-    Get the application version.
+    Enable pandas Copy-on-Write for the session.
 
-    Returns:
-        Version string
+    DataFrames passed between tab states and data bus messages then share
+    their memory until one side modifies them, instead of being copied.
+    Copy-on-Write is always on from pandas 3.0, where the option is deprecated.
     """
-    return __version__
+    import pandas as pd
+
+    if int(pd.__version__.split(".", 1)[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
 
 
 def setup_application(
@@ -76,34 +89,36 @@ def setup_application(
     Returns:
         Tuple of (logger, config)
     """
-    # Set up logging
-    logger = setup_application_logging(debug_mode=args.debug, log_directory=Path(".logs"))
+    # Load or reset configuration first so the final debug level is known
+    # before the logger is built. Defaults are valid by construction.
+    is_valid, errors = True, []
+    if args.reset_config:
+        config = reset_to_defaults()
+    else:
+        config = get_user_config()
+        is_valid, errors = validate_config(config)
 
-    logger.info(f"Starting ANAFIS version {get_version()}")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {sys.platform}")
+    # Set up logging once, honouring debug mode from either source
+    debug_mode = args.debug or config.advanced.debug_mode
+    logger = setup_application_logging(debug_mode=debug_mode, log_directory=args.log_dir or APP_LOG_DIR)
+
+    logger.info("Starting ANAFIS version %s", get_version())
+    logger.info("Python version: %s", sys.version)
+    logger.info("Platform: %s", sys.platform)
 
-    # Load or reset configuration
     if args.reset_config:
         logger.info("Resetting configuration to defaults")
-        config = reset_to_defaults()
     else:
         logger.info("Loading user configuration")
-        config = get_user_config()
 
-    # Validate configuration
-    is_valid, errors = validate_config(config)
     if not is_valid:
         logger.warning("Configuration validation failed:")
         for error in errors:
-            logger.warning(f"  - {error}")
+            logger.warning("  - %s", error)
         logger.info("Using default values for invalid settings")
 
-    # Update debug mode from config if not set via command line
-    if not args.debug and config.advanced.debug_mode:
+    if debug_mode and not args.debug:
         logger.info("Debug mode enabled via configuration")
-        # Re-setup logging with debug mode
-        logger = setup_application_logging(debug_mode=True, log_directory=args.log_dir)
 
     logger.info("Application setup complete")
     return logger, config
@@ -123,13 +138,20 @@ def main() -> int:
         # Set up application (logging, config)
         logger, config = setup_application(args)
 
-        # Create GUI application (unless no-gui mode)
-        app = None if args.no_gui else create_gui_application(logger, config)
+        # Create and run the GUI application (unless no-gui mode). The GUI
+        # modules are imported here so --help, --version and --no-gui never
+        # pay for loading Qt.
+        if args.no_gui:
+            logger.info("Running in no-GUI mode")
+            exit_code = 0
+        else:
+            enable_pandas_copy_on_write()
+            from anafis.gui.gui import create_gui_application, run_application
 
-        # Run the application
-        exit_code = run_application(app, logger, config)
+            app = create_gui_application(logger, config)
+            exit_code = run_application(app, logger, config)
 
-        logger.info(f"Application exiting with code {exit_code}")
+        logger.info("Application exiting with code %s", exit_code)
         return exit_code
 
     except KeyboardInterrupt:
@@ -6,25 +6,40 @@ using functional programming patterns and immutable data structures.
 """
 
 import json
+import os
 import sys
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Optional, cast, Literal, Tuple, Union
-from dataclasses import asdict
-from enum import Enum
+from typing import Any, Callable, Dict, Mapping, Optional, cast, get_origin, Tuple, TypeVar
+from dataclasses import MISSING, fields, replace
 from anafis.core.data_structures import (
-    Theme,
     ApplicationConfig,
     ComputationConfig,
     GeneralConfig,
     InterfaceConfig,
     UpdateConfig,
     AdvancedConfig,
-    Language,
-    UpdateChannel,
     ConfigDict,
     JSON_VALUE,
 )
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None  # type: ignore[assignment]
+
+# Parsed configurations keyed by file path, with the file's (mtime_ns, size) at load time
+_loaded_config_cache: Dict[Path, Tuple[Tuple[int, int], ApplicationConfig]] = {}
+
+# What was last written to each config file: the config, whether it was pretty-printed
+# and the file's mtime after the write
+_saved_configs: Dict[Path, Tuple[ApplicationConfig, bool, int]] = {}
+
+# Encoded JSON of the most recently saved configuration as (config, pretty, payload);
+# configs are immutable, so identity is a valid key, and bytes cannot be modified by callers
+_last_config_payload: Optional[Tuple[ApplicationConfig, bool, bytes]] = None
+
 
 def create_application_config(
     general: GeneralConfig = GeneralConfig(),
@@ -38,6 +53,7 @@ def create_application_config(
     return ApplicationConfig(general, computation, interface, updates, advanced, config_version)
 
 
+@cache
 def get_default_config_directory() -> Path:
     """
     Get the default directory for configuration files.
@@ -46,10 +62,10 @@ def get_default_config_directory() -> Path:
         Path to the default configuration directory
     """
     if sys.platform == "win32":
-        # Windows: Use AppData/Roaming
-        import os
-
-        app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+        # Windows: Use AppData/Roaming, only falling back to the home directory when unset
+        app_data = os.environ.get("APPDATA")
+        if app_data is None:
+            app_data = os.path.expanduser("~")
         return Path(app_data) / "ANAFIS"
     elif sys.platform == "darwin":
         # macOS: Use ~/Library/Application Support
@@ -70,11 +86,16 @@ def get_config_file_path(config_dir: Optional[Path] = None) -> Path:
         Path to the configuration file
     """
     if config_dir is None:
-        config_dir = get_default_config_directory()
+        return _default_config_file_path()
 
     return config_dir / "config.json"
 
 
+@cache
+def _default_config_file_path() -> Path:
+    return get_default_config_directory() / "config.json"
+
+
 def create_default_config() -> ApplicationConfig:
     """
     Create a default application configuration.
@@ -95,38 +116,15 @@ def config_to_dict(config: ApplicationConfig) -> ConfigDict:
     Returns:
         Dictionary representation of the configuration
     """
-    config_dict: ConfigDict = {
-        "general": {},
-        "computation": {},
-        "interface": {},
-        "updates": {},
-        "advanced": {},
+    return {
+        "general": config.general.to_dict(),
+        "computation": config.computation.to_dict(),
+        "interface": config.interface.to_dict(),
+        "updates": config.updates.to_dict(),
+        "advanced": config.advanced.to_dict(),
         "config_version": config.config_version,
     }
 
-    # Process each section to convert Enums to their values
-    for section_name in ConfigDict.__annotations__.keys():
-        if section_name == "config_version":
-            continue
-        section_data = getattr(config, section_name)
-        section_dict = asdict(section_data)  # Convert dataclass to dict
-
-        for key, value in section_dict.items():
-            if isinstance(value, Enum):
-                enum_str_value: str = value.value  # Explicitly type as str
-                section_dict[key] = enum_str_value
-            elif isinstance(value, dict):
-                # Handle nested dictionaries (like floating_tool_shortcuts)
-                for nested_key, nested_value in value.items():
-                    if isinstance(nested_value, Enum):
-                        nested_enum_str_value: str = nested_value.value  # Explicitly type as str
-                        value[nested_key] = nested_enum_str_value
-        config_dict[cast(Literal["general", "computation", "interface", "updates", "advanced"], section_name)] = (
-            section_dict
-        )
-
-    return config_dict
-
 
 def dict_to_config(config_dict: ConfigDict) -> ApplicationConfig:
     """
@@ -138,118 +136,103 @@ def dict_to_config(config_dict: ConfigDict) -> ApplicationConfig:
     Returns:
         ApplicationConfig instance
     """
-
-    def convert_enums(section_name: str, section_dict: Dict[str, JSON_VALUE]) -> Dict[str, Union[JSON_VALUE, Enum]]:
-        """Convert string values back to enums where appropriate."""
-        converted: Dict[str, Union[JSON_VALUE, Enum]] = {k: v for k, v in section_dict.items()}
-
-        # Define enum mappings for each section
-        enum_mappings = {
-            "general": {"language": Language, "theme": Theme},
-            "updates": {"update_channel": UpdateChannel},
-        }
-
-        if section_name in enum_mappings:
-            for field, enum_class in cast(Dict[str, type[Enum]], enum_mappings[section_name]).items():
-                if field in converted:
-                    try:
-                        value = converted[field]
-                        if isinstance(value, (str, int, float)):
-                            converted[field] = enum_class(value)
-                    except (ValueError, TypeError):
-                        # Keep original value if enum conversion fails
-                        pass
-
-        return converted
-
-    # Extract sections with enum conversion
-    general_dict = convert_enums("general", config_dict.get("general", {}))
-    computation_dict = config_dict.get("computation", {})
-    interface_dict = config_dict.get("interface", {})
-    updates_dict = convert_enums("updates", config_dict.get("updates", {}))
-    advanced_dict = config_dict.get("advanced", {})
-
-    # Create section instances
-    general = _dict_to_general_config(general_dict)
-    computation = _dict_to_computation_config(computation_dict)
-    interface = _dict_to_interface_config(interface_dict)
-    updates = _dict_to_update_config(updates_dict)
-    advanced = _dict_to_advanced_config(advanced_dict)
+    # Sections missing from the file reuse the shared default instances
+    # instead of being decoded from an empty dictionary
+    defaults = create_default_config()
+    general_data = config_dict.get("general")
+    computation_data = config_dict.get("computation")
+    interface_data = config_dict.get("interface")
+    updates_data = config_dict.get("updates")
+    advanced_data = config_dict.get("advanced")
+
+    # Create section instances; the generated loaders decode the enum fields
+    general = _dict_to_general_config(general_data) if general_data else defaults.general
+    computation = _dict_to_computation_config(computation_data) if computation_data else defaults.computation
+    interface = _dict_to_interface_config(interface_data) if interface_data else defaults.interface
+    updates = _dict_to_update_config(updates_data) if updates_data else defaults.updates
+    advanced = _dict_to_advanced_config(advanced_data) if advanced_data else defaults.advanced
 
     config_version = config_dict.get("config_version", "1.0")
 
     return create_application_config(general, computation, interface, updates, advanced, config_version)
 
 
-def _dict_to_general_config(data: Dict[str, Union[JSON_VALUE, Enum]]) -> GeneralConfig:
-    return GeneralConfig(
-        language=Language(data.get("language", Language.ENGLISH.value)),
-        theme=Theme(data.get("theme", Theme.SYSTEM.value)),
-        startup_behavior=cast(str, data.get("startup_behavior", "restore_session")),
-        auto_save_interval=cast(int, data.get("auto_save_interval", 300)),
-        recent_files_limit=cast(int, data.get("recent_files_limit", 10)),
-        show_splash_screen=cast(bool, data.get("show_splash_screen", True)),
-        check_updates_on_startup=cast(bool, data.get("check_updates_on_startup", True)),
-    )
-
-
-def _dict_to_computation_config(data: Dict[str, JSON_VALUE]) -> ComputationConfig:
-    return ComputationConfig(
-        default_fitting_method=cast(str, data.get("default_fitting_method", "lm")),
-        numerical_precision=cast(int, data.get("numerical_precision", 15)),
-        max_iterations=cast(int, data.get("max_iterations", 1000)),
-        convergence_tolerance=cast(float, data.get("convergence_tolerance", 1e-8)),
-        use_gpu_acceleration=cast(bool, data.get("use_gpu_acceleration", True)),
-        gpu_device_id=cast(Optional[int], data.get("gpu_device_id", None)),
-        parallel_processing=cast(bool, data.get("parallel_processing", True)),
-        max_workers=cast(Optional[int], data.get("max_workers", None)),
-    )
-
-
-def _dict_to_interface_config(data: Dict[str, JSON_VALUE]) -> InterfaceConfig:
-    return InterfaceConfig(
-        tab_detach_enabled=cast(bool, data.get("tab_detach_enabled", True)),
-        tab_close_confirmation=cast(bool, data.get("tab_close_confirmation", True)),
-        show_tooltips=cast(bool, data.get("show_tooltips", True)),
-        animation_enabled=cast(bool, data.get("animation_enabled", True)),
-        status_bar_visible=cast(bool, data.get("status_bar_visible", True)),
-        toolbar_visible=cast(bool, data.get("toolbar_visible", True)),
-        floating_tool_shortcuts=cast(Dict[str, str], data.get("floating_tool_shortcuts", {})),
-        plot_default_style=cast(str, data.get("plot_default_style", "seaborn-v0_8")),
-        plot_dpi=cast(int, data.get("plot_dpi", 100)),
-    )
-
-
-def _dict_to_update_config(data: Dict[str, Union[JSON_VALUE, Enum]]) -> UpdateConfig:
-    return UpdateConfig(
-        auto_check_enabled=cast(bool, data.get("auto_check_enabled", True)),
-        check_interval_hours=cast(int, data.get("check_interval_hours", 24)),
-        update_channel=UpdateChannel(data.get("update_channel", UpdateChannel.STABLE.value)),
-        auto_download=cast(bool, data.get("auto_download", False)),
-        notify_beta_releases=cast(bool, data.get("notify_beta_releases", False)),
-        github_api_token=cast(Optional[str], data.get("github_api_token", None)),
-    )
-
-
-def _dict_to_advanced_config(data: Dict[str, JSON_VALUE]) -> AdvancedConfig:
-    return AdvancedConfig(
-        debug_mode=cast(bool, data.get("debug_mode", False)),
-        log_level=cast(str, data.get("log_level", "INFO")),
-        memory_limit_mb=cast(Optional[int], data.get("memory_limit_mb", None)),
-        cache_size_mb=cast(int, data.get("cache_size_mb", 100)),
-        enable_profiling=cast(bool, data.get("enable_profiling", False)),
-        experimental_features=cast(bool, data.get("experimental_features", False)),
-        custom_plugin_paths=cast(Tuple[str, ...], data.get("custom_plugin_paths", ())),
-    )
-
-
-def save_config(config: ApplicationConfig, config_file: Optional[Path] = None) -> bool:
+_SectionT = TypeVar("_SectionT")
+
+
+def _as_pairs(value: Any) -> Tuple[Tuple[str, str], ...]:
+    """Convert a JSON object (or a sequence of pairs) to a tuple of (key, value) pairs."""
+    if isinstance(value, Mapping):
+        return tuple(value.items())
+    return tuple((key, item) for key, item in value)
+
+
+def _make_section_loader(section_cls: type[_SectionT]) -> Callable[[Mapping[str, Any]], _SectionT]:
+    """
+    Generate a specialized dictionary-to-section constructor for a config dataclass.
+
+    The generated function looks up every field by name with its default
+    inlined, decodes enum fields through the enum's value map, coerces tuple
+    fields, and calls the dataclass directly, so loading does no per-call
+    introspection of the dataclass.
+
+    Args:
+        section_cls: Config section dataclass to build a loader for
+
+    Returns:
+        Function creating a section instance from its dictionary form
+    """
+    namespace: Dict[str, Any] = {"section_cls": section_cls}
+    enum_fields = dict(getattr(section_cls, "_enum_fields", ()))
+    arguments = []
+
+    for section_field in fields(cast(Any, section_cls)):
+        name = section_field.name
+        if section_field.default is not MISSING:
+            namespace[f"default_{name}"] = section_field.default
+            value = f"data.get({name!r}, default_{name})"
+        else:
+            namespace[f"factory_{name}"] = section_field.default_factory
+            value = f"data[{name!r}] if {name!r} in data else factory_{name}()"
+
+        if name in enum_fields:
+            # Decode by value through the enum's own value map, falling back to
+            # the enum constructor only for values that are not plain member values
+            enum_class = enum_fields[name]
+            namespace[f"enum_{name}"] = enum_class
+            namespace[f"members_{name}"] = enum_class._value2member_map_
+            if section_field.default is not MISSING:
+                namespace[f"default_{name}"] = section_field.default.value
+            value = f"members_{name}[value] if (value := {value}) in members_{name} else enum_{name}(value)"
+        elif section_field.type == Tuple[Tuple[str, str], ...]:
+            # Stored in JSON as an object, kept in the section as (key, value) pairs
+            namespace["as_pairs"] = _as_pairs
+            value = f"as_pairs({value})"
+        elif get_origin(section_field.type) is tuple:
+            value = f"tuple({value})"
+
+        arguments.append(f"        {name}={value},")
+
+    source = "\n".join(["def load(data):", "    return section_cls(", *arguments, "    )"])
+    exec(compile(source, f"<config loader for {section_cls.__name__}>", "exec"), namespace)
+    return cast(Callable[[Mapping[str, Any]], _SectionT], namespace["load"])
+
+
+_dict_to_general_config = _make_section_loader(GeneralConfig)
+_dict_to_computation_config = _make_section_loader(ComputationConfig)
+_dict_to_interface_config = _make_section_loader(InterfaceConfig)
+_dict_to_update_config = _make_section_loader(UpdateConfig)
+_dict_to_advanced_config = _make_section_loader(AdvancedConfig)
+
+
+def save_config(config: ApplicationConfig, config_file: Optional[Path] = None, pretty: bool = False) -> bool:
     """
     Save configuration to file.
 
     Args:
         config: ApplicationConfig to save
         config_file: Path to config file, uses default if None
+        pretty: Write indented JSON for a human reader instead of compact JSON
 
     Returns:
         True if successful, False otherwise
@@ -261,12 +244,24 @@ def save_config(config: ApplicationConfig, config_file: Optional[Path] = None) -
         # Ensure config directory exists
         config_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dictionary and save
-        config_dict = config_to_dict(config)
+        # Skip the save when the file still holds exactly what we last wrote; configs are
+        # hashable and immutable, so an equal config does not even need to be encoded
+        saved = _saved_configs.get(config_file)
+        if saved is not None and saved[1] == pretty and (saved[0] is config or saved[0] == config):
+            try:
+                if config_file.stat().st_mtime_ns == saved[2]:
+                    return True
+            except OSError:
+                pass
 
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        payload = _config_payload(config, pretty)
 
+        _write_file_durably(config_file, payload)
+
+        # The file now holds exactly this config, so a later load can reuse it without parsing
+        stat = config_file.stat()
+        _saved_configs[config_file] = (config, pretty, stat.st_mtime_ns)
+        _loaded_config_cache[config_file] = ((stat.st_mtime_ns, stat.st_size), config)
         return True
 
     except Exception as e:
@@ -275,10 +270,69 @@ def save_config(config: ApplicationConfig, config_file: Optional[Path] = None) -
         return False
 
 
+def _write_file_durably(target: Path, payload: bytes) -> None:
+    """
+    Write a file in one unbuffered write, sync it to disk and move it into place.
+
+    The payload goes to a temporary sibling that is fsynced before it atomically
+    replaces the target, so a crash never leaves a truncated config file. The
+    target keeps its permissions, and the temporary file is removed if any step fails.
+    """
+    temp_file = target.with_name(target.name + ".tmp")
+    # Keep the permissions of an existing file (it may hold an API token); new files are private
+    try:
+        mode = os.stat(target).st_mode & 0o7777
+    except OSError:
+        mode = 0o600
+
+    # O_BINARY (Windows only) stops the C runtime from translating "\n" to "\r\n"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(temp_file, flags, 0o600)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # os.open applies the umask, so set the final mode explicitly
+        os.chmod(temp_file, mode)
+        os.replace(temp_file, target)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def _config_payload(config: ApplicationConfig, pretty: bool) -> bytes:
+    """Encode a configuration as JSON, reusing the payload of the most recently encoded config."""
+    global _last_config_payload
+
+    cached = _last_config_payload
+    if cached is not None and cached[0] is config and cached[1] == pretty:
+        return cached[2]
+
+    payload = _encode_config(config_to_dict(config), pretty)
+    _last_config_payload = (config, pretty, payload)
+    return payload
+
+
+def _encode_config(config_dict: ConfigDict, pretty: bool) -> bytes:
+    """Encode a configuration dictionary as UTF-8 JSON, indented if pretty."""
+    if orjson is not None:
+        return orjson.dumps(config_dict, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(config_dict)
+    if pretty:
+        return json.dumps(config_dict, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(config_dict, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def load_config(config_file: Optional[Path] = None) -> ApplicationConfig:
     """
     Load configuration from file.
 
+    The parsed configuration is cached per path and reused for as long as
+    the file's modification time and size are unchanged.
+
     Args:
         config_file: Path to config file, uses default if None
 
@@ -289,20 +343,30 @@ def load_config(config_file: Optional[Path] = None) -> ApplicationConfig:
         config_file = get_config_file_path()
 
     # Return default config if file doesn't exist
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except OSError:
         return create_default_config()
 
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _loaded_config_cache.get(config_file)
+    if cached is not None and cached[0] == file_key:
+        return cached[1]
+
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            config_dict = json.load(f)
+        raw = config_file.read_bytes()
+        config_dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-        return dict_to_config(config_dict)
+        config = dict_to_config(config_dict)
 
     except Exception as e:
         # In a real application, this would use the logging system
         print(f"Error loading configuration: {e}")
         return create_default_config()
 
+    _loaded_config_cache[config_file] = (file_key, config)
+    return config
+
 
 def update_config(
     current_config: ApplicationConfig, section: str, updates_dict: Dict[str, JSON_VALUE]
@@ -318,52 +382,37 @@ def update_config(
     Returns:
         New ApplicationConfig with updates applied
     """
-    # Get current section
-    current_section = getattr(current_config, section)
-
-    # Convert to dict, apply updates, and create new section
-    section_dict = asdict(current_section)
-    section_dict.update(updates_dict)
-
-    # Create new section instance
-    section_classes = {
-        "general": GeneralConfig,
-        "computation": ComputationConfig,
-        "interface": InterfaceConfig,
-        "updates": UpdateConfig,
-        "advanced": AdvancedConfig,
-    }
+    # Nothing to change: keep the same immutable config (and its cached serialization)
+    if not updates_dict:
+        return current_config
 
-    new_section = section_classes[section](**section_dict)
+    # Copy the section with the updated fields; untouched fields are shared, not deep-copied
+    new_section = replace(getattr(current_config, section), **updates_dict)
 
     # Create new config with updated section
-    general = current_config.general
-    computation = current_config.computation
-    interface = current_config.interface
-    updates = current_config.updates
-    advanced = current_config.advanced
-    config_version = current_config.config_version
-
-    # Apply the updated section
-    if section == "general":
-        general = new_section
-    elif section == "computation":
-        computation = new_section
-    elif section == "interface":
-        interface = new_section
-    elif section == "updates":
-        updates = new_section
-    elif section == "advanced":
-        advanced = new_section
-
-    return create_application_config(
-        general=general,
-        computation=computation,
-        interface=interface,
-        updates=updates,
-        advanced=advanced,
-        config_version=config_version,
-    )
+    return replace(current_config, **{section: new_section})
+
+
+# Validation rules as (field accessor, predicate, error message), built once at import
+_VALIDATION_RULES: Tuple[Tuple[Callable[[ApplicationConfig], Any], Callable[[Any], bool], str], ...] = (
+    # General config
+    (attrgetter("general.auto_save_interval"), lambda v: v >= 30, "Auto-save interval must be at least 30 seconds"),
+    (attrgetter("general.recent_files_limit"), lambda v: v >= 1, "Recent files limit must be at least 1"),
+    # Computation config
+    (
+        attrgetter("computation.numerical_precision"),
+        lambda v: 1 <= v <= 50,
+        "Numerical precision must be between 1 and 50",
+    ),
+    (attrgetter("computation.max_iterations"), lambda v: v >= 1, "Max iterations must be at least 1"),
+    (attrgetter("computation.convergence_tolerance"), lambda v: v > 0, "Convergence tolerance must be positive"),
+    # Interface config
+    (attrgetter("interface.plot_dpi"), lambda v: 50 <= v <= 300, "Plot DPI must be between 50 and 300"),
+    # Update config
+    (attrgetter("updates.check_interval_hours"), lambda v: v >= 1, "Update check interval must be at least 1 hour"),
+    # Advanced config
+    (attrgetter("advanced.cache_size_mb"), lambda v: v >= 10, "Cache size must be at least 10 MB"),
+)
 
 
 def validate_config(config: ApplicationConfig) -> tuple[bool, list[str]]:
@@ -376,36 +425,7 @@ def validate_config(config: ApplicationConfig) -> tuple[bool, list[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
-
-    # Validate general config
-    if config.general.auto_save_interval < 30:
-        errors.append("Auto-save interval must be at least 30 seconds")
-
-    if config.general.recent_files_limit < 1:
-        errors.append("Recent files limit must be at least 1")
-
-    # Validate computation config
-    if config.computation.numerical_precision < 1 or config.computation.numerical_precision > 50:
-        errors.append("Numerical precision must be between 1 and 50")
-
-    if config.computation.max_iterations < 1:
-        errors.append("Max iterations must be at least 1")
-
-    if config.computation.convergence_tolerance <= 0:
-        errors.append("Convergence tolerance must be positive")
-
-    # Validate interface config
-    if config.interface.plot_dpi < 50 or config.interface.plot_dpi > 300:
-        errors.append("Plot DPI must be between 50 and 300")
-
-    # Validate update config
-    if config.updates.check_interval_hours < 1:
-        errors.append("Update check interval must be at least 1 hour")
-
-    # Validate advanced config
-    if config.advanced.cache_size_mb < 10:
-        errors.append("Cache size must be at least 10 MB")
+    errors = [message for accessor, predicate, message in _VALIDATION_RULES if not predicate(accessor(config))]
 
     return len(errors) == 0, errors
 
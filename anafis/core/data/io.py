@@ -2,9 +2,152 @@
 Pure functions for data input/output.
 """
 
+import os
+from importlib.util import find_spec
+from typing import Callable, Dict, Optional
+
 import pandas as pd
 from anafis.core.data_structures import ImportSettings
 
+try:
+    import pyarrow as pa
+    from pyarrow import compute as pa_compute
+    from pyarrow import csv as pa_csv
+except ImportError:  # Optional speedup; fall back to the pandas parser
+    pa = None  # type: ignore[assignment]
+    pa_compute = None  # type: ignore[assignment]
+    pa_csv = None  # type: ignore[assignment]
+
+# Rust-backed Excel reader, used for .xlsx and .xls when installed; None lets pandas choose
+_EXCEL_ENGINE = "calamine" if find_spec("python_calamine") is not None else None
+
+# Files at least this large are memory-mapped instead of read through buffered file I/O
+_MEMORY_MAP_THRESHOLD = 64 * 1024 * 1024
+
+# Integers at least this large overflow int64, and pyarrow reads their column as float64
+_INT64_OVERFLOW = 2**63
+
+
+def _should_memory_map(file_path: str) -> bool:
+    """Returns True if the file is large enough to benefit from memory mapping."""
+    try:
+        return os.path.getsize(file_path) >= _MEMORY_MAP_THRESHOLD
+    except OSError:
+        return False
+
+
+def _read_arrow_table(
+    file_path: str,
+    read_options: "pa_csv.ReadOptions",
+    parse_options: "pa_csv.ParseOptions",
+    convert_options: "pa_csv.ConvertOptions",
+) -> "pa.Table":
+    """Read a delimited text file into an Arrow table, memory-mapping large files."""
+    if _should_memory_map(file_path):
+        with pa.memory_map(file_path) as mapped_file:
+            return pa_csv.read_csv(
+                mapped_file, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+            )
+    return pa_csv.read_csv(
+        file_path, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+    )
+
+
+def _matches_pandas_inference(table: "pa.Table") -> bool:
+    """
+    Check that pandas would build the same columns from the file as pyarrow did.
+
+    pandas renames duplicate header names ("a", "a.1") and keeps integers beyond
+    int64 as uint64 or object, while pyarrow keeps the names and falls back to float64.
+    """
+    if len(set(table.column_names)) != table.num_columns:
+        return False
+    for field in table.schema:
+        if pa.types.is_floating(field.type):
+            extremes = pa_compute.min_max(table.column(field.name)).as_py()
+            if any(value is not None and abs(value) >= _INT64_OVERFLOW for value in extremes.values()):
+                return False
+    return True
+
+
+def _read_csv_arrow(file_path: str, settings: ImportSettings) -> Optional[pd.DataFrame]:
+    """
+    Read a delimited text file with pyarrow's multithreaded CSV reader.
+
+    Args:
+        file_path: Path to the file.
+        settings: Dictionary of import settings.
+
+    Returns:
+        A pandas DataFrame, or None if the file must be read by pandas instead.
+    """
+    delimiter = settings.get("delimiter", ",")
+    # Partial reads (previews) are cheaper through pandas, which stops early,
+    # and pyarrow only supports single-character delimiters
+    if pa_csv is None or settings.get("nrows") is not None or len(delimiter) != 1:
+        return None
+
+    header = settings.get("header", True)
+    read_options = pa_csv.ReadOptions(skip_rows=settings.get("skiprows", 0), autogenerate_column_names=not header)
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    try:
+        # Like pandas, read empty and NA-like text fields as missing values
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        table = _read_arrow_table(file_path, read_options, parse_options, convert_options)
+        # pandas keeps dates and times as text, so re-read the columns pyarrow inferred as temporal as strings
+        temporal_columns = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+        if temporal_columns:
+            convert_options.column_types = {name: pa.string() for name in temporal_columns}
+            table = _read_arrow_table(file_path, read_options, parse_options, convert_options)
+    except pa.ArrowInvalid:
+        # Input pyarrow rejects (e.g. ragged rows) is left to the more lenient pandas parser
+        return None
+    if not _matches_pandas_inference(table):
+        return None
+
+    dataframe = table.to_pandas()
+    if not header:
+        # Match pandas' integer column labels for header-less files
+        dataframe.columns = pd.RangeIndex(len(dataframe.columns))
+    return dataframe
+
+
+def _read_csv(file_path: str, settings: ImportSettings) -> pd.DataFrame:
+    """Read a delimited text file, preferring pyarrow and falling back to pandas."""
+    dataframe = _read_csv_arrow(file_path, settings)
+    if dataframe is not None:
+        return dataframe
+    return pd.read_csv(
+        file_path,
+        sep=settings.get("delimiter", ","),
+        header=0 if settings.get("header", True) else None,
+        skiprows=settings.get("skiprows", 0),
+        nrows=settings.get("nrows"),
+        memory_map=_should_memory_map(file_path),
+    )
+
+
+def _read_excel(file_path: str, settings: ImportSettings) -> pd.DataFrame:
+    """Read a sheet from an Excel workbook."""
+    return pd.read_excel(
+        file_path,
+        sheet_name=settings.get("sheet_name", "Sheet1"),
+        header=0 if settings.get("header", True) else None,
+        skiprows=settings.get("skiprows", 0),
+        nrows=settings.get("nrows"),
+        engine=_EXCEL_ENGINE,
+    )
+
+
+# File type detected from each supported extension, and the reader for each file type
+_EXTENSION_FILE_TYPES: Dict[str, str] = {".csv": "csv", ".txt": "txt", ".xlsx": "excel", ".xls": "excel"}
+
+_READERS: Dict[str, Callable[[str, ImportSettings], pd.DataFrame]] = {
+    "csv": _read_csv,
+    "txt": _read_csv,
+    "excel": _read_excel,
+}
+
 
 def load_dataframe(file_path: str, settings: ImportSettings) -> pd.DataFrame:
     """
@@ -20,28 +163,9 @@ def load_dataframe(file_path: str, settings: ImportSettings) -> pd.DataFrame:
     file_type = settings.get("file_type", "autodetect")
 
     if file_type == "autodetect":
-        if file_path.endswith(".csv"):
-            file_type = "csv"
-        elif file_path.endswith(".txt"):
-            file_type = "txt"
-        elif file_path.endswith((".xlsx", ".xls")):
-            file_type = "excel"
-
-    if file_type in ["csv", "txt"]:
-        return pd.read_csv(
-            file_path,
-            sep=settings.get("delimiter", ","),
-            header=0 if settings.get("header", True) else None,
-            skiprows=settings.get("skiprows", 0),
-            nrows=settings.get("nrows"),
-        )
-    elif file_type == "excel":
-        return pd.read_excel(
-            file_path,
-            sheet_name=settings.get("sheet_name", "Sheet1"),
-            header=0 if settings.get("header", True) else None,
-            skiprows=settings.get("skiprows", 0),
-            nrows=settings.get("nrows"),
-        )
-    else:
+        file_type = _EXTENSION_FILE_TYPES.get(os.path.splitext(file_path)[1].lower(), file_type)
+
+    reader = _READERS.get(file_type)
+    if reader is None:
         raise ValueError(f"Unsupported file type: {file_type}")
+    return reader(file_path, settings)
@@ -2,20 +2,45 @@
 Core data structures for ANAFIS.
 """
 
-from typing import NamedTuple, Dict, Optional, List, Union, TypedDict, Callable
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    List,
+    Union,
+    TypedDict,
+    Callable,
+    ClassVar,
+    Tuple,
+)
 import logging
+import math
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-import pandas as pd
-import networkx as nx
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing them here would make every config
+    # load pay for pandas and NumPy
+    import pandas as pd
+    from anafis.core.dependency_graph import DepGraph
 
 JSON_VALUE = Union[str, int, float, bool, None, "JsonDict", "JsonList"]
 JsonDict = Dict[str, JSON_VALUE]
 JsonList = List[JSON_VALUE]
 
+# Shared read-only default for mapping fields of the state containers
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+def _empty_mapping() -> Mapping[str, Any]:
+    return _EMPTY_MAPPING
+
+
+@dataclass(frozen=True, slots=True)
 class Parameter:
     """Represents a parameter for fitting."""
 
@@ -26,11 +51,17 @@ class Parameter:
     max_value: Optional[float] = None
 
     def __post_init__(self) -> None:
-        if self.min_value is not None and self.max_value is not None and self.min_value > self.max_value:
+        min_value, max_value = self.min_value, self.max_value
+        if min_value is None and max_value is None:
+            return  # Unbounded: nothing to check
+        # A missing bound never fails its comparison, so each check is one compare
+        low = -math.inf if min_value is None else min_value
+        high = math.inf if max_value is None else max_value
+        if low > high:
             raise ValueError("min_value cannot be greater than max_value")
-        if self.min_value is not None and self.value < self.min_value:
+        if self.value < low:
             raise ValueError("value cannot be less than min_value")
-        if self.max_value is not None and self.value > self.max_value:
+        if self.value > high:
             raise ValueError("value cannot be greater than max_value")
 
 
@@ -48,39 +79,56 @@ class FittingMethod(Enum):
     MCMC = "mcmc"
 
 
-class FittingResults(TypedDict, total=False):
-    type: str
+@dataclass(frozen=True, slots=True)
+class FittingResults:
+    """Outcome of a fitting run."""
+
     model_type: str
-    coefficients: List[float]
-    coefficients_uncertainties: List[float]
+    coefficients: Tuple[float, ...]
     equation: str
     r_squared: float
     rmse: float
     iterations_used: int
     converged: bool
+    coefficients_uncertainties: Tuple[float, ...] = ()
+
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of the results, as published on the data bus."""
+        return {
+            "model_type": self.model_type,
+            "coefficients": list(self.coefficients),
+            "coefficients_uncertainties": list(self.coefficients_uncertainties),
+            "equation": self.equation,
+            "r_squared": self.r_squared,
+            "rmse": self.rmse,
+            "iterations_used": self.iterations_used,
+            "converged": self.converged,
+        }
 
 
-class FittingState(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class FittingState:
     """
     Immutable state for the fitting tab.
     """
 
-    source_data: Optional[pd.DataFrame] = None
+    source_data: Optional["pd.DataFrame"] = None
     model_formula: str = ""
     method: FittingMethod = FittingMethod.LEVENBERG_MARQUARDT
-    parameters: Dict[str, Parameter] = {}
+    parameters: Mapping[str, Parameter] = field(default_factory=_empty_mapping)
     results: Optional[FittingResults] = None
 
 
-class SpreadsheetState(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class SpreadsheetState:
     """
     Immutable state for the spreadsheet tab.
     """
 
-    data: Optional[pd.DataFrame] = None
-    formulas: Dict[str, str] = {}
-    units: Dict[str, str] = {}
-    dependencies: Optional[nx.DiGraph] = None
+    data: Optional["pd.DataFrame"] = None
+    formulas: Mapping[str, str] = field(default_factory=_empty_mapping)
+    units: Mapping[str, str] = field(default_factory=_empty_mapping)
+    dependencies: Optional["DepGraph"] = None
 
 
 class ImportSettings(TypedDict, total=False):
@@ -140,22 +188,32 @@ class DataPayload(TypedDict, total=False):
     version: str
 
 
-class SerializedDataFrame(TypedDict):
+class _SerializedDataFrameBase(TypedDict):
     type: str
-    data: List[Dict[str, Union[str, int, float, bool, None]]]
     columns: List[str]
     dtypes: Dict[str, str]
-    index: List[Union[str, int, float, None]]
     shape: tuple[int, ...]
 
 
-class SerializedNumpyArray(TypedDict):
+class SerializedDataFrame(_SerializedDataFrameBase, total=False):
+    # Arrow IPC stream of the frame; "data"/"index" records are used when Arrow is unavailable
+    ipc_bytes: bytes
+    data: List[Dict[str, Union[str, int, float, bool, None]]]
+    index: List[Union[str, int, float, None]]
+
+
+class _SerializedNumpyArrayBase(TypedDict):
     type: str
-    data: List[Union[str, int, float, bool, None]]
     dtype: str
     shape: tuple[int, ...]
 
 
+class SerializedNumpyArray(_SerializedNumpyArrayBase, total=False):
+    # Raw array buffer; "data" holds a nested list for object arrays
+    buffer: bytes
+    data: List[Union[str, int, float, bool, None]]
+
+
 class FittingData(TypedDict):
     type: str
     data: SerializedDataFrame
@@ -166,7 +224,7 @@ class FittingData(TypedDict):
 
 class MonteCarloResults(TypedDict):
     type: str
-    simulation_data: Union[SerializedDataFrame, pd.DataFrame]
+    simulation_data: Union[SerializedDataFrame, "pd.DataFrame"]
     parameters: Dict[str, JSON_VALUE]
 
 
@@ -230,6 +288,21 @@ class GeneralConfig:
     show_splash_screen: bool = True
     check_updates_on_startup: bool = True
 
+    # Fields stored as enums, with the enum used to decode them from JSON
+    _enum_fields: ClassVar[Tuple[Tuple[str, type[Enum]], ...]] = (("language", Language), ("theme", Theme))
+
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of this section."""
+        return {
+            "language": self.language.value,
+            "theme": self.theme.value,
+            "startup_behavior": self.startup_behavior,
+            "auto_save_interval": self.auto_save_interval,
+            "recent_files_limit": self.recent_files_limit,
+            "show_splash_screen": self.show_splash_screen,
+            "check_updates_on_startup": self.check_updates_on_startup,
+        }
+
 
 @dataclass(frozen=True)
 class ComputationConfig:
@@ -244,6 +317,19 @@ class ComputationConfig:
     parallel_processing: bool = True
     max_workers: Optional[int] = None  # None = auto-detect
 
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of this section."""
+        return {
+            "default_fitting_method": self.default_fitting_method,
+            "numerical_precision": self.numerical_precision,
+            "max_iterations": self.max_iterations,
+            "convergence_tolerance": self.convergence_tolerance,
+            "use_gpu_acceleration": self.use_gpu_acceleration,
+            "gpu_device_id": self.gpu_device_id,
+            "parallel_processing": self.parallel_processing,
+            "max_workers": self.max_workers,
+        }
+
 
 @dataclass(frozen=True)
 class InterfaceConfig:
@@ -255,12 +341,11 @@ class InterfaceConfig:
     animation_enabled: bool = True
     status_bar_visible: bool = True
     toolbar_visible: bool = True
-    floating_tool_shortcuts: Dict[str, str] = field(
-        default_factory=lambda: {
-            "uncertainty_calculator": "F9",
-            "quick_solver": "Alt+S",
-            "unit_converter": "Ctrl+U",
-        }
+    # (tool, shortcut) pairs; a tuple rather than a dict keeps the section hashable
+    floating_tool_shortcuts: Tuple[Tuple[str, str], ...] = (
+        ("uncertainty_calculator", "F9"),
+        ("quick_solver", "Alt+S"),
+        ("unit_converter", "Ctrl+U"),
     )
     plot_default_style: str = "seaborn-v0_8"
     plot_dpi: int = 100
@@ -283,6 +368,32 @@ class InterfaceConfig:
     show_drop_indicators: bool = True
     drag_preview_opacity: float = 0.7
 
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of this section."""
+        return {
+            "tab_detach_enabled": self.tab_detach_enabled,
+            "tab_close_confirmation": self.tab_close_confirmation,
+            "show_tooltips": self.show_tooltips,
+            "animation_enabled": self.animation_enabled,
+            "status_bar_visible": self.status_bar_visible,
+            "toolbar_visible": self.toolbar_visible,
+            "floating_tool_shortcuts": dict(self.floating_tool_shortcuts),
+            "plot_default_style": self.plot_default_style,
+            "plot_dpi": self.plot_dpi,
+            "tab_drag_threshold": self.tab_drag_threshold,
+            "tab_detach_threshold": self.tab_detach_threshold,
+            "enable_cross_window_drag": self.enable_cross_window_drag,
+            "animate_tab_operations": self.animate_tab_operations,
+            "smart_window_positioning": self.smart_window_positioning,
+            "cascade_offset_x": self.cascade_offset_x,
+            "cascade_offset_y": self.cascade_offset_y,
+            "default_detached_window_width": self.default_detached_window_width,
+            "default_detached_window_height": self.default_detached_window_height,
+            "show_drag_preview": self.show_drag_preview,
+            "show_drop_indicators": self.show_drop_indicators,
+            "drag_preview_opacity": self.drag_preview_opacity,
+        }
+
 
 @dataclass(frozen=True)
 class UpdateConfig:
@@ -295,6 +406,20 @@ class UpdateConfig:
     notify_beta_releases: bool = False
     github_api_token: Optional[str] = None  # For higher rate limits
 
+    # Fields stored as enums, with the enum used to decode them from JSON
+    _enum_fields: ClassVar[Tuple[Tuple[str, type[Enum]], ...]] = (("update_channel", UpdateChannel),)
+
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of this section."""
+        return {
+            "auto_check_enabled": self.auto_check_enabled,
+            "check_interval_hours": self.check_interval_hours,
+            "update_channel": self.update_channel.value,
+            "auto_download": self.auto_download,
+            "notify_beta_releases": self.notify_beta_releases,
+            "github_api_token": self.github_api_token,
+        }
+
 
 @dataclass(frozen=True)
 class AdvancedConfig:
@@ -306,10 +431,23 @@ class AdvancedConfig:
     cache_size_mb: int = 100
     enable_profiling: bool = False
     experimental_features: bool = False
-    custom_plugin_paths: tuple = ()
+    custom_plugin_paths: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, JSON_VALUE]:
+        """Return a JSON-ready dictionary of this section."""
+        return {
+            "debug_mode": self.debug_mode,
+            "log_level": self.log_level,
+            "memory_limit_mb": self.memory_limit_mb,
+            "cache_size_mb": self.cache_size_mb,
+            "enable_profiling": self.enable_profiling,
+            "experimental_features": self.experimental_features,
+            "custom_plugin_paths": list(self.custom_plugin_paths),
+        }
 
 
-class ApplicationConfig(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class ApplicationConfig:
     """
     Immutable application configuration container.
 
@@ -337,6 +475,8 @@ class ConfigDict(TypedDict):
 class TabRegistration:
     """Information about a registered tab."""
 
+    __slots__ = ("tab_id", "tab_type", "callback", "is_active", "message_count", "last_activity")
+
     def __init__(self, tab_id: str, tab_type: str, callback: Optional[Callable] = None):
         self.tab_id = tab_id
         self.tab_type = tab_type
@@ -347,13 +487,12 @@ class TabRegistration:
 
 
 TabData = Union[
-    pd.DataFrame,
+    "pd.DataFrame",
     Dict[str, JSON_VALUE],
     List[JSON_VALUE],
     str,
     float,
     int,
-    FittingResults,
     FittingData,
     SerializedDataFrame,
     ApplicationConfig,
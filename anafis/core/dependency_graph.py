@@ -0,0 +1,137 @@
+"""
+Compact cell dependency graph for ANAFIS spreadsheets.
+
+This module provides an immutable graph stored as CSR (compressed sparse row)
+arrays, so recompute-order traversals run over integer arrays instead of
+nested dictionaries.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+@dataclass(frozen=True, eq=False)
+class DepGraph:
+    """
+    Immutable directed dependency graph in CSR layout.
+
+    Graphs compare by identity, since the generated field-wise equality is
+    ambiguous for the NumPy array fields.
+
+    The dependents of the node ``names[i]`` are the nodes at the positions
+    ``indices[indptr[i]:indptr[i + 1]]``; an edge ``u -> v`` means ``v`` must
+    be recomputed after ``u``.
+    """
+
+    names: Tuple[str, ...]
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @classmethod
+    def from_edges(cls, names: Iterable[str], edges: Iterable[Tuple[str, str]]) -> "DepGraph":
+        """
+        Build a graph from node names and ``(source, dependent)`` edges.
+
+        Args:
+            names: Node names; nodes that only appear in edges are appended
+            edges: Pairs of (source, dependent) node names
+
+        Returns:
+            DepGraph containing every node and edge
+        """
+        name_list = list(dict.fromkeys(names))
+        index: Dict[str, int] = {name: i for i, name in enumerate(name_list)}
+        sources = []
+        targets = []
+        for source, target in edges:
+            for name in (source, target):
+                if name not in index:
+                    index[name] = len(name_list)
+                    name_list.append(name)
+            sources.append(index[source])
+            targets.append(index[target])
+
+        source_array = np.asarray(sources, dtype=np.intp)
+        target_array = np.asarray(targets, dtype=np.intp)
+        order = np.argsort(source_array, kind="stable")
+        indptr = np.zeros(len(name_list) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(source_array, minlength=len(name_list)), out=indptr[1:])
+        return cls(tuple(name_list), indptr, target_array[order])
+
+    @classmethod
+    def from_networkx(cls, graph: "nx.DiGraph") -> "DepGraph":
+        """Build a graph from a networkx DiGraph with string nodes."""
+        return cls.from_edges(graph.nodes, graph.edges)
+
+    def to_networkx(self) -> "nx.DiGraph":
+        """Convert the graph to a networkx DiGraph."""
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.names)
+        graph.add_edges_from(
+            (self.names[source], self.names[target])
+            for source in range(len(self.names))
+            for target in self.indices[self.indptr[source] : self.indptr[source + 1]]
+        )
+        return graph
+
+    @cached_property
+    def _positions(self) -> Dict[str, int]:
+        """Position of each node name, built on first lookup."""
+        return {name: i for i, name in enumerate(self.names)}
+
+    def dependents(self, name: str) -> Tuple[str, ...]:
+        """
+        Return the nodes that depend directly on a node.
+
+        Args:
+            name: Node name
+
+        Returns:
+            Names of the direct dependents, empty for unknown nodes
+        """
+        position = self._positions.get(name)
+        if position is None:
+            return ()
+        return tuple(self.names[i] for i in self.indices[self.indptr[position] : self.indptr[position + 1]])
+
+    def topo_order(self) -> np.ndarray:
+        """
+        Compute a recompute order with Kahn's algorithm, one frontier at a time.
+
+        Returns:
+            Node positions in dependency order
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        node_count = len(self.names)
+        in_degree = np.bincount(self.indices, minlength=node_count)
+        frontier = np.flatnonzero(in_degree == 0)
+        levels = []
+
+        while frontier.size:
+            levels.append(frontier)
+            # Gather the dependents of every node in the frontier in one vectorized step
+            starts = self.indptr[frontier]
+            lengths = self.indptr[frontier + 1] - starts
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            dependents = self.indices[offsets]
+            in_degree -= np.bincount(dependents, minlength=node_count)
+            frontier = np.unique(dependents[in_degree[dependents] == 0])
+
+        order = np.concatenate(levels) if levels else np.empty(0, dtype=np.intp)
+        if order.size != node_count:
+            raise ValueError("Dependency graph contains a cycle")
+        return order
+
+    def topo_names(self) -> Tuple[str, ...]:
+        """Return the node names in dependency order."""
+        return tuple(self.names[i] for i in self.topo_order())
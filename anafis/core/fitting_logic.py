@@ -5,11 +5,21 @@ This module provides pure functions for performing various fitting operations,
 ensuring that business logic is separated from GUI concerns.
 """
 
-import random
+from typing import Dict, Tuple
 
+import numpy as np
 import pandas as pd
 from anafis.core.data_structures import FittingResults
 
+_RNG = np.random.default_rng()
+
+# Sampling ranges (low, high) of the simulated coefficients, followed by r_squared and rmse
+_SIMULATED_BOUNDS: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+    "linear": (np.array([-10.0, -5.0, 0.85, 0.1]), np.array([10.0, 5.0, 0.99, 2.0])),
+    "quadratic": (np.array([-1.0, -5.0, -10.0, 0.85, 0.1]), np.array([1.0, 5.0, 10.0, 0.99, 2.0])),
+    "power": (np.array([0.1, -2.0, 0.85, 0.1]), np.array([2.0, 2.0, 0.99, 2.0])),
+}
+
 
 def perform_fitting(
     data: pd.DataFrame,
@@ -30,40 +40,30 @@ def perform_fitting(
         tolerance: The convergence tolerance for the fitting algorithm.
 
     Returns:
-        A FittingResults TypedDict containing the fitting outcomes.
+        A FittingResults instance containing the fitting outcomes.
     """
     if data.empty:
         raise ValueError("Input data for fitting cannot be empty.")
 
-    # Simulate fitting results based on model_type
-    coefficients: list[float]
+    # Simulate fitting results based on model_type, defaulting to power if not recognized;
+    # all values are drawn in a single generator call
+    low, high = _SIMULATED_BOUNDS.get(model_type, _SIMULATED_BOUNDS["power"])
+    *coefficients, r_squared, rmse = _RNG.uniform(low, high).tolist()
     equation: str
 
     if model_type == "linear":
-        coefficients = [random.uniform(-10, 10), random.uniform(-5, 5)]
         equation = f"y = {coefficients[0]:.3f} * x + {coefficients[1]:.3f}"
     elif model_type == "quadratic":
-        coefficients = [
-            random.uniform(-1, 1),
-            random.uniform(-5, 5),
-            random.uniform(-10, 10),
-        ]
         equation = f"y = {coefficients[0]:.3f} * x² + {coefficients[1]:.3f} * x + {coefficients[2]:.3f}"
-    else:  # Default to power or similar if not recognized
-        coefficients = [random.uniform(0.1, 2), random.uniform(-2, 2)]
+    else:
         equation = f"y = {coefficients[0]:.3f} * x^{coefficients[1]:.3f}"
 
-    r_squared = random.uniform(0.85, 0.99)
-    rmse = random.uniform(0.1, 2.0)
-
-    fitting_results: FittingResults = {
-        "model_type": model_type,
-        "coefficients": coefficients,
-        "equation": equation,
-        "r_squared": r_squared,
-        "rmse": rmse,
-        "iterations_used": random.randint(10, max_iterations),
-        "converged": True,
-    }
-
-    return fitting_results
+    return FittingResults(
+        model_type=model_type,
+        coefficients=tuple(coefficients),
+        equation=equation,
+        r_squared=r_squared,
+        rmse=rmse,
+        iterations_used=int(_RNG.integers(10, max_iterations, endpoint=True)),
+        converged=True,
+    )
@@ -5,13 +5,55 @@ This module provides pure functions for setting up and configuring
 the application's logging system using Python's built-in logging module.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
-from anafis.core.data_structures import LoggerConfig
+from anafis.core.data_structures import HandlerConfig, LoggerConfig
+
+# Application logger, created once at import; handlers are attached by setup_application_logging()
+APP_LOGGER = logging.getLogger("anafis")
+APP_LOGGER.addHandler(logging.NullHandler())
+
+# Working-directory log folder used by the application, and the session snapshot kept in it
+APP_LOG_DIR = Path(".logs")
+SESSION_FILE = APP_LOG_DIR / "complete_session.json"
+
+# Background listeners that feed each configured logger's handlers, by logger name
+_QUEUE_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+
+
+# Log format strings by (include_timestamp, include_module)
+_LOG_FORMATS: Dict[Tuple[bool, bool], str] = {
+    (True, True): "%(asctime)s - %(levelname)-8s - %(name)s - %(module)s:%(lineno)d - %(message)s",
+    (True, False): "%(asctime)s - %(levelname)-8s - %(name)s - %(message)s",
+    (False, True): "%(levelname)-8s - %(name)s - %(module)s:%(lineno)d - %(message)s",
+    (False, False): "%(levelname)-8s - %(name)s - %(message)s",
+}
+
+_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records logged within the same second."""
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        # Valid because the date format has one-second resolution
+        second = int(record.created)
+        cached_second, cached_time = self._cached_time
+        if second == cached_second:
+            return cached_time
+        formatted = super().formatTime(record, datefmt)
+        self._cached_time = (second, formatted)
+        return formatted
 
 
 def create_log_formatter(include_timestamp: bool = True, include_module: bool = True) -> logging.Formatter:
@@ -25,21 +67,7 @@ def create_log_formatter(include_timestamp: bool = True, include_module: bool =
     Returns:
         Configured logging.Formatter instance
     """
-    format_parts = []
-
-    if include_timestamp:
-        format_parts.append("%(asctime)s")
-
-    format_parts.extend(["%(levelname)-8s", "%(name)s"])
-
-    if include_module:
-        format_parts.append("%(module)s:%(lineno)d")
-
-    format_parts.append("%(message)s")
-
-    format_string = " - ".join(format_parts)
-
-    return logging.Formatter(fmt=format_string, datefmt="%Y-%m-%d %H:%M:%S")
+    return _CachedTimeFormatter(fmt=_LOG_FORMATS[include_timestamp, include_module], datefmt=_LOG_DATE_FORMAT)
 
 
 def create_console_handler(
@@ -103,6 +131,25 @@ def create_file_handler(
     return handler
 
 
+def _console_handler_from_config(handler_config: HandlerConfig) -> logging.Handler:
+    return create_console_handler(level=handler_config["level"], formatter=handler_config["formatter"])
+
+
+def _file_handler_from_config(handler_config: HandlerConfig) -> logging.Handler:
+    return create_file_handler(
+        log_file_path=handler_config["path"],
+        level=handler_config["level"],
+        formatter=handler_config["formatter"],
+    )
+
+
+# Handler factory for each handler "type" in a LoggerConfig; unknown types are skipped
+_HANDLER_FACTORIES: Dict[str, Callable[[HandlerConfig], logging.Handler]] = {
+    "console": _console_handler_from_config,
+    "file": _file_handler_from_config,
+}
+
+
 def get_default_log_directory() -> Path:
     """
     Get the default directory for log files.
@@ -191,23 +238,29 @@ def setup_logger(config: LoggerConfig) -> logging.Logger:
     logger = logging.getLogger(config["name"])
     logger.setLevel(config["level"])
 
-    # Clear any existing handlers
+    # Clear any existing handlers, stopping the listener that fed them
     logger.handlers.clear()
+    previous_listener = _QUEUE_LISTENERS.pop(config["name"], None)
+    if previous_listener is not None:
+        previous_listener.stop()
+        atexit.unregister(previous_listener.stop)
 
-    # Add configured handlers
+    # Build configured handlers
+    handlers: List[logging.Handler] = []
     for handler_config in config["handlers"]:
-        if handler_config["type"] == "console":
-            handler = create_console_handler(level=handler_config["level"], formatter=handler_config["formatter"])
-        elif handler_config["type"] == "file":
-            handler = create_file_handler(
-                log_file_path=handler_config["path"],
-                level=handler_config["level"],
-                formatter=handler_config["formatter"],
-            )
-        else:
-            continue
-
-        logger.addHandler(handler)
+        factory = _HANDLER_FACTORIES.get(handler_config["type"])
+        if factory is not None:
+            handlers.append(factory(handler_config))
+
+    # The logger only enqueues records; a background thread does the console
+    # and file I/O, so logging calls never block on the handlers
+    if handlers:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener.start()
+        atexit.register(listener.stop)
+        _QUEUE_LISTENERS[config["name"]] = listener
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -219,6 +272,8 @@ def setup_application_logging(debug_mode: bool = False, log_directory: Optional[
     """
     Set up the main application logger with standard configuration.
 
+    Calling this again once handlers are attached only updates the level.
+
     Args:
         debug_mode: Whether to enable debug-level logging
         log_directory: Custom log directory, uses default if None
@@ -228,6 +283,10 @@ def setup_application_logging(debug_mode: bool = False, log_directory: Optional[
     """
     level = logging.DEBUG if debug_mode else logging.INFO
 
+    if any(not isinstance(handler, logging.NullHandler) for handler in APP_LOGGER.handlers):
+        APP_LOGGER.setLevel(level)
+        return APP_LOGGER
+
     config = create_logger_config(
         name="anafis",
         level=level,
@@ -6,3 +6,8 @@ from anafis.core.data_structures import TabState
 @runtime_checkable
 class HasGetState(Protocol):
     def get_state(self) -> TabState: ...
+
+
+@runtime_checkable
+class HasSetTabName(Protocol):
+    def set_tab_name(self, new_name: str) -> None: ...
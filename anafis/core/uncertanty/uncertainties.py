@@ -1,34 +1,49 @@
 import math
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Sequence, Tuple
 
+import numpy as np
 import sympy as sp
-from sympy import Expr
 
 from anafis.core.uncertanty.formula_generator import _get_math_functions, _preprocess_formula
 
+# A formula compiled to numeric functions: its value and one partial derivative per
+# variable, each taking the variable values positionally
+CompiledFormula = Tuple[Callable[..., Any], Tuple[Callable[..., Any], ...]]
 
-class UncertaintyCalculator:
-    """Calculator for uncertainty propagation in mathematical formulas."""
 
-    @staticmethod
-    def _calculate_formula_value(expr: Expr, variables_values: Dict[str, float]) -> float:
-        """Calculate the final value of the formula."""
-        expr_substituted = expr.subs(variables_values)
-        return float(sp.N(expr_substituted))
+@lru_cache(maxsize=128)
+def _compile_formula(formula: str, variables: Tuple[str, ...]) -> CompiledFormula:
+    """
+    Parse a formula and compile it and its partial derivatives to numeric functions.
 
-    @staticmethod
-    def _calculate_uncertainty(
-        expr: Expr, variaveis: Dict[str, Tuple[float, float]], variables_values: Dict[str, float]
-    ) -> float:
-        """Calculate the total uncertainty using error propagation."""
-        incerteza_total = 0.0
-        for var, (_, sigma) in variaveis.items():
-            symbol_var = sp.Symbol(var)
-            derivada = sp.diff(expr, symbol_var)
-            derivada_substituted = derivada.subs(variables_values)
-            derivada_num = float(sp.N(derivada_substituted))
-            incerteza_total += (derivada_num * sigma) ** 2
-        return math.sqrt(incerteza_total)
+    Parsing and differentiation do not depend on the variable values, so repeated
+    evaluations of the same formula (e.g. Monte Carlo samples) reuse the compiled functions.
+
+    Args:
+        formula: Mathematical formula as string
+        variables: Variable names, in the order the compiled functions take them
+
+    Returns:
+        Tuple containing (value_function, partial_derivative_functions)
+    """
+    expr = _preprocess_formula(formula, list(variables), _get_math_functions())
+    symbols = [sp.Symbol(var) for var in variables]
+    # SciPy supplies array versions of the special functions NumPy lacks (e.g. erf, gamma, Ei);
+    # SymPy only covers what is left, and those functions work on scalars only
+    modules = ["scipy", "numpy", "sympy"]
+    value_function = sp.lambdify(symbols, expr, modules)
+    derivative_functions = tuple(sp.lambdify(symbols, expr.diff(symbol), modules) for symbol in symbols)
+    return value_function, derivative_functions
+
+
+def _evaluate_columns(function: Callable[..., Any], columns: np.ndarray, sample_count: int) -> np.ndarray:
+    """Evaluate a compiled function on per-variable sample columns, broadcasting constant results."""
+    return np.array(np.broadcast_to(np.asarray(function(*columns), dtype=float), (sample_count,)))
+
+
+class UncertaintyCalculator:
+    """Calculator for uncertainty propagation in mathematical formulas."""
 
     @staticmethod
     def calcular_incerteza(
@@ -41,21 +56,55 @@ class UncertaintyCalculator:
         Args:
             formula: Mathematical formula as string
             variaveis: Dictionary mapping variable names to (value, uncertainty) tuples
-            language: Language for error messages ('pt' or 'en')
 
         Returns:
             Tuple containing (final_value, total_uncertainty)
         """
-        math_functions = _get_math_functions()
-        variable_names = list(variaveis.keys())
-        formula = _preprocess_formula(formula, variable_names, math_functions)
+        values = np.array([[value for value, _ in variaveis.values()]], dtype=float)
+        sigmas = np.array([sigma for _, sigma in variaveis.values()], dtype=float)
+
+        # A single sample of the batch calculation; undefined points come back as NaN
+        valores_finais, incertezas_totais = UncertaintyCalculator.calcular_incerteza_batch(
+            formula, tuple(variaveis), values, sigmas
+        )
+        valor_final = float(valores_finais[0])
+        incerteza_total = float(incertezas_totais[0])
+        if not (math.isfinite(valor_final) and math.isfinite(incerteza_total)):
+            raise ValueError("Error processing formula: Formula does not evaluate to a finite real number")
+        return valor_final, incerteza_total
+
+    @staticmethod
+    def calcular_incerteza_batch(
+        formula: str,
+        variable_names: Sequence[str],
+        values: np.ndarray,
+        sigmas: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate uncertainty propagation for many samples of the variables at once.
 
+        Args:
+            formula: Mathematical formula as string
+            variable_names: Variable names, in the column order of values and sigmas
+            values: Variable values with shape (samples, variables)
+            sigmas: Uncertainties with shape (variables,) or (samples, variables)
+
+        Returns:
+            Tuple containing (final_values, total_uncertainties), each with shape (samples,).
+            Samples where the formula is undefined evaluate to NaN.
+        """
         try:
-            expr = sp.sympify(formula, locals=math_functions)
-            variables_values = {k: v[0] for k, v in variaveis.items()}
+            value_function, derivative_functions = _compile_formula(formula, tuple(variable_names))
+            values = np.asarray(values, dtype=float)
+            sample_count = values.shape[0]
+            columns = values.T
 
-            valor_final = UncertaintyCalculator._calculate_formula_value(expr, variables_values)
-            incerteza_total = UncertaintyCalculator._calculate_uncertainty(expr, variaveis, variables_values)
-            return valor_final, incerteza_total
+            with np.errstate(all="ignore"):
+                valores_finais = _evaluate_columns(value_function, columns, sample_count)
+                derivadas = np.empty((sample_count, len(derivative_functions)))
+                for i, derivative_function in enumerate(derivative_functions):
+                    derivadas[:, i] = _evaluate_columns(derivative_function, columns, sample_count)
+                incertezas_totais = np.sqrt(((derivadas * np.asarray(sigmas, dtype=float)) ** 2).sum(axis=1))
+            return valores_finais, incertezas_totais
         except Exception as e:
             raise ValueError(f"Error processing formula: {str(e)}") from e
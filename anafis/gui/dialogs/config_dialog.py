@@ -1,20 +1,20 @@
 import logging
-from typing import Optional
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog,
+    QFormLayout,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
     QTabWidget,
     QWidget,
-    QLabel,
     QComboBox,
     QSpinBox,
     QDoubleSpinBox,
     QMessageBox,
 )
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QSignalBlocker
 
 from anafis.core.config import ApplicationConfig, save_config
 from anafis.core.data_structures import (
@@ -23,21 +23,35 @@ from anafis.core.data_structures import (
     GeneralConfig,
     ComputationConfig,
 )
+from anafis.gui.gui import get_app_icon
 
 logger = logging.getLogger(__name__)
 
+# Tab positions, matching the order of ConfigDialog._tab_specs
+_GENERAL_TAB = 0
+_COMPUTATION_TAB = 1
+
+# (label, value) entries of the language and theme combo boxes
+_LANG_ITEMS: Tuple[Tuple[str, str], ...] = tuple((lang.name.capitalize(), lang.value) for lang in Language)
+_THEME_ITEMS: Tuple[Tuple[str, str], ...] = tuple((theme.name.capitalize(), theme.value) for theme in Theme)
+# Combo box index of each language and theme value
+_LANG_INDEX: Dict[str, int] = {value: index for index, (_, value) in enumerate(_LANG_ITEMS)}
+_THEME_INDEX: Dict[str, int] = {value: index for index, (_, value) in enumerate(_THEME_ITEMS)}
+
 
 class ConfigDialog(QDialog):
     def __init__(self, current_config: ApplicationConfig, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("ANAFIS Configuration")
-        self.setWindowIcon(QIcon(":/icons/anafis.png"))  # Assuming an icon exists
+        icon = get_app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
         self._config = current_config
         self._new_config = current_config  # This will hold changes
+        self._dirty = False  # Whether the UI values differ from current_config
 
         self._setup_ui()
-        self._load_config_to_ui()
 
     def _setup_ui(self) -> None:
         main_layout = QVBoxLayout(self)
@@ -45,17 +59,18 @@ class ConfigDialog(QDialog):
         self.tab_widget = QTabWidget(self)
         main_layout.addWidget(self.tab_widget)
 
-        # General Tab
-        self._general_tab = QWidget()
-        self._setup_general_tab_ui()
-        self.tab_widget.addTab(self._general_tab, "General")
-
-        # Computation Tab
-        self._computation_tab = QWidget()
-        self._setup_computation_tab_ui()
-        self.tab_widget.addTab(self._computation_tab, "Computation")
-
-        # Add more tabs as needed (Interface, Updates, Advanced)
+        # Tabs start as empty pages and are built and loaded when first shown,
+        # so opening the dialog only lays out the visible tab
+        self._tab_specs: Tuple[Tuple[str, Callable[[QWidget], None], Callable[[], None]], ...] = (
+            ("General", self._setup_general_tab_ui, self._load_general_to_ui),
+            ("Computation", self._setup_computation_tab_ui, self._load_computation_to_ui),
+            # Add more tabs as needed (Interface, Updates, Advanced)
+        )
+        self._built_tabs: Set[int] = set()
+        for title, _, _ in self._tab_specs:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -69,89 +84,106 @@ class ConfigDialog(QDialog):
 
         main_layout.addLayout(button_layout)
 
-    def _setup_general_tab_ui(self) -> None:
-        layout = QVBoxLayout(self._general_tab)
+    def _ensure_tab_built(self, index: int) -> None:
+        if index < 0 or index in self._built_tabs:
+            return
+        _, build_tab, load_tab = self._tab_specs[index]
+        build_tab(self.tab_widget.widget(index))
+        load_tab()
+        self._built_tabs.add(index)
+
+    def _setup_general_tab_ui(self, tab: QWidget) -> None:
+        form = QFormLayout(tab)
 
-        # Language
-        lang_layout = QHBoxLayout()
-        lang_layout.addWidget(QLabel("Language:"))
         self.lang_combo = QComboBox()
-        for lang in Language:
-            self.lang_combo.addItem(lang.name.capitalize(), lang.value)
-        lang_layout.addWidget(self.lang_combo)
-        lang_layout.addStretch()
-        layout.addLayout(lang_layout)
-
-        # Theme
-        theme_layout = QHBoxLayout()
-        theme_layout.addWidget(QLabel("Theme:"))
+        for label, value in _LANG_ITEMS:
+            self.lang_combo.addItem(label, value)
+        form.addRow("Language:", self.lang_combo)
+
         self.theme_combo = QComboBox()
-        for theme in Theme:
-            self.theme_combo.addItem(theme.name.capitalize(), theme.value)
-        theme_layout.addWidget(self.theme_combo)
-        theme_layout.addStretch()
-        layout.addLayout(theme_layout)
-
-        # Auto-save interval
-        auto_save_layout = QHBoxLayout()
-        auto_save_layout.addWidget(QLabel("Auto-save Interval (seconds):"))
+        for label, value in _THEME_ITEMS:
+            self.theme_combo.addItem(label, value)
+        form.addRow("Theme:", self.theme_combo)
+
         self.auto_save_spin = QSpinBox()
         self.auto_save_spin.setRange(30, 3600)
         self.auto_save_spin.setSingleStep(30)
-        auto_save_layout.addWidget(self.auto_save_spin)
-        auto_save_layout.addStretch()
-        layout.addLayout(auto_save_layout)
+        form.addRow("Auto-save Interval (seconds):", self.auto_save_spin)
 
-        layout.addStretch()
+    def _setup_computation_tab_ui(self, tab: QWidget) -> None:
+        form = QFormLayout(tab)
 
-    def _setup_computation_tab_ui(self) -> None:
-        layout = QVBoxLayout(self._computation_tab)
-
-        # Numerical Precision
-        precision_layout = QHBoxLayout()
-        precision_layout.addWidget(QLabel("Numerical Precision:"))
         self.precision_spin = QSpinBox()
         self.precision_spin.setRange(1, 50)
-        precision_layout.addWidget(self.precision_spin)
-        precision_layout.addStretch()
-        layout.addLayout(precision_layout)
+        form.addRow("Numerical Precision:", self.precision_spin)
 
-        # Max Iterations
-        max_iter_layout = QHBoxLayout()
-        max_iter_layout.addWidget(QLabel("Max Iterations:"))
         self.max_iter_spin = QSpinBox()
         self.max_iter_spin.setRange(1, 10000)
-        max_iter_layout.addWidget(self.max_iter_spin)
-        max_iter_layout.addStretch()
-        layout.addLayout(max_iter_layout)
+        form.addRow("Max Iterations:", self.max_iter_spin)
 
-        # Convergence Tolerance
-        tolerance_layout = QHBoxLayout()
-        tolerance_layout.addWidget(QLabel("Convergence Tolerance:"))
         self.tolerance_spin = QDoubleSpinBox()
         self.tolerance_spin.setDecimals(10)
         self.tolerance_spin.setRange(1e-12, 1.0)
         self.tolerance_spin.setSingleStep(1e-6)
-        tolerance_layout.addWidget(self.tolerance_spin)
-        tolerance_layout.addStretch()
-        layout.addLayout(tolerance_layout)
-
-        layout.addStretch()
+        form.addRow("Convergence Tolerance:", self.tolerance_spin)
 
-    def _load_config_to_ui(self) -> None:
-        # General
-        self.lang_combo.setCurrentIndex(self.lang_combo.findData(self._config.general.language.value))
-        self.theme_combo.setCurrentIndex(self.theme_combo.findData(self._config.general.theme.value))
+    def _load_general_to_ui(self) -> None:
+        # Populating the widgets must not trigger their change handlers
+        blockers = [QSignalBlocker(w) for w in (self.lang_combo, self.theme_combo, self.auto_save_spin)]
+        self.lang_combo.setCurrentIndex(_LANG_INDEX[self._config.general.language.value])
+        self.theme_combo.setCurrentIndex(_THEME_INDEX[self._config.general.theme.value])
         self.auto_save_spin.setValue(self._config.general.auto_save_interval)
+        for blocker in blockers:
+            blocker.unblock()
 
-        # Computation
+    def _load_computation_to_ui(self) -> None:
+        blockers = [QSignalBlocker(w) for w in (self.precision_spin, self.max_iter_spin, self.tolerance_spin)]
         self.precision_spin.setValue(self._config.computation.numerical_precision)
         self.max_iter_spin.setValue(self._config.computation.max_iterations)
         self.tolerance_spin.setValue(self._config.computation.convergence_tolerance)
+        for blocker in blockers:
+            blocker.unblock()
 
     def _save_ui_to_config(self) -> None:
-        # Create new config objects from UI values
-        new_general = GeneralConfig(
+        # Only sections whose tab was shown and edited are rebuilt; the others keep the original section
+        general_dirty = _GENERAL_TAB in self._built_tabs and self._general_changed()
+        computation_dirty = _COMPUTATION_TAB in self._built_tabs and self._computation_changed()
+        self._dirty = general_dirty or computation_dirty
+        if not self._dirty:
+            self._new_config = self._config
+            return
+
+        new_general = self._general_from_ui() if general_dirty else self._config.general
+        new_computation = self._computation_from_ui() if computation_dirty else self._config.computation
+
+        # Create the new ApplicationConfig
+        self._new_config = ApplicationConfig(
+            general=new_general,
+            computation=new_computation,
+            interface=self._config.interface,  # Keep original for now
+            updates=self._config.updates,  # Keep original for now
+            advanced=self._config.advanced,  # Keep original for now
+            config_version=self._config.config_version,
+        )
+
+    def _general_changed(self) -> bool:
+        general = self._config.general
+        return (
+            self.lang_combo.currentData() != general.language.value
+            or self.theme_combo.currentData() != general.theme.value
+            or self.auto_save_spin.value() != general.auto_save_interval
+        )
+
+    def _computation_changed(self) -> bool:
+        computation = self._config.computation
+        return (
+            self.precision_spin.value() != computation.numerical_precision
+            or self.max_iter_spin.value() != computation.max_iterations
+            or self.tolerance_spin.value() != computation.convergence_tolerance
+        )
+
+    def _general_from_ui(self) -> GeneralConfig:
+        return GeneralConfig(
             language=Language(self.lang_combo.currentData()),
             theme=Theme(self.theme_combo.currentData()),
             auto_save_interval=self.auto_save_spin.value(),
@@ -161,7 +193,9 @@ class ConfigDialog(QDialog):
             show_splash_screen=self._config.general.show_splash_screen,
             check_updates_on_startup=self._config.general.check_updates_on_startup,
         )
-        new_computation = ComputationConfig(
+
+    def _computation_from_ui(self) -> ComputationConfig:
+        return ComputationConfig(
             numerical_precision=self.precision_spin.value(),
             max_iterations=self.max_iter_spin.value(),
             convergence_tolerance=self.tolerance_spin.value(),
@@ -173,19 +207,12 @@ class ConfigDialog(QDialog):
             max_workers=self._config.computation.max_workers,
         )
 
-        # Create the new ApplicationConfig
-        self._new_config = ApplicationConfig(
-            general=new_general,
-            computation=new_computation,
-            interface=self._config.interface,  # Keep original for now
-            updates=self._config.updates,  # Keep original for now
-            advanced=self._config.advanced,  # Keep original for now
-            config_version=self._config.config_version,
-        )
-
     def accept(self) -> None:
         self._save_ui_to_config()
-        if save_config(self._new_config):
+        if not self._dirty:
+            # Nothing was edited, so the saved configuration is already up to date
+            super().accept()
+        elif save_config(self._new_config, pretty=True):
             super().accept()
         else:
             QMessageBox.critical(self, "Error", "Failed to save configuration.")
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import (
     QDialog,
@@ -14,15 +14,119 @@ from PyQt6.QtWidgets import (
     QWidget,
     QScrollArea,
 )
+import re
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, cast
-import matplotlib.pyplot as plt
-from io import BytesIO
-from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 from anafis.core.uncertanty.uncertainties import UncertaintyCalculator
 from anafis.core.uncertanty.formula_generator import generate_uncertainty_formula
 
 
+# Variable names in the comma-separated variables input; whitespace also separates names
+_VAR_TOKEN_RE = re.compile(r"[^,\s]+")
+
+# Rendered formula PNGs by (latex, fg_color, bg_color, dpi), least recently used first.
+# Rendering runs an external LaTeX process, so re-rendering the same formula is avoided.
+_LATEX_PNG_CACHE: "OrderedDict[Tuple[str, str, str, int], bytes]" = OrderedDict()
+_LATEX_PNG_CACHE_SIZE = 64
+
+# Per-thread matplotlib figure reused across renders by _render_latex_png
+_render_state = threading.local()
+
+
+def _render_latex_png(latex: str, fg_color: str, bg_color: str, dpi: float) -> bytes:
+    """
+    Render a LaTeX string to PNG bytes with matplotlib.
+
+    Args:
+        latex: LaTeX math to render, without the surrounding $ delimiters
+        fg_color: Text color
+        bg_color: Background color
+        dpi: Logical DPI of the target screen, used to scale the font
+
+    Returns:
+        PNG image data
+
+    Raises:
+        FileNotFoundError: If no LaTeX renderer is installed
+        RuntimeError: If LaTeX fails to render the formula
+    """
+    # matplotlib is imported on first render so opening the dialog does not load it
+    from io import BytesIO
+
+    import matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    matplotlib.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
+    buffer = BytesIO()
+
+    # Uses a standalone Agg figure instead of pyplot, which is not thread-safe. Each
+    # worker thread keeps its figure and canvas and only replaces the text per render.
+    fig: Optional[Figure] = getattr(_render_state, "figure", None)
+    if fig is None:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _render_state.figure = fig
+    else:
+        fig.clear()
+    fig.set_facecolor(bg_color)
+    canvas_agg = cast(FigureCanvasAgg, fig.canvas)
+
+    font_size = 30 * dpi / 96.0
+    text = fig.text(
+        0,
+        0,
+        f"${latex}$",
+        ha="center",
+        va="center",
+        color=fg_color,
+        fontsize=font_size,
+        usetex=True,
+        family="serif",
+    )
+
+    # Dynamically adjust font size
+    renderer = canvas_agg.get_renderer()
+    bbox = text.get_window_extent(renderer=renderer)
+
+    fig.set_size_inches(bbox.width / fig.dpi, bbox.height / fig.dpi)
+
+    fig.savefig(buffer, format="png", bbox_inches="tight", pad_inches=0, facecolor=bg_color)
+    return buffer.getvalue()
+
+
+class _LatexRenderSignals(QObject):
+    """Signals emitted by a LaTeX render task."""
+
+    # (generation, cache key, PNG bytes, error); the bytes are empty when rendering failed
+    finished = pyqtSignal(int, object, bytes, str)
+
+
+class _LatexRenderTask(QRunnable):
+    """Renders a LaTeX formula to PNG bytes on a worker thread."""
+
+    def __init__(self, generation: int, key: Tuple[str, str, str, int], dpi: float) -> None:
+        super().__init__()
+        self.signals = _LatexRenderSignals()
+        self._generation = generation
+        self._key = key
+        self._dpi = dpi
+
+    def run(self) -> None:
+        latex, fg_color, bg_color, _ = self._key
+        try:
+            png_bytes = _render_latex_png(latex, fg_color, bg_color, self._dpi)
+        except FileNotFoundError:
+            self.signals.finished.emit(self._generation, self._key, b"", "renderer_not_found")
+        except Exception as e:
+            # An exception escaping run() would abort the application
+            self.signals.finished.emit(self._generation, self._key, b"", str(e))
+        else:
+            self.signals.finished.emit(self._generation, self._key, png_bytes, "")
+
+
 class UncertaintyCalculatorDialog(QDialog):
     """
     A dialog for performing uncertainty calculations and generating LaTeX formulas.
@@ -35,6 +139,19 @@ class UncertaintyCalculatorDialog(QDialog):
         # Dictionary to store references to variable input fields
         self.variable_inputs: Dict[str, Tuple[QLineEdit, QLineEdit]] = {}
         self._current_variables: List[str] = []
+        # (raw variables text, parsed variable names) of the last parse
+        self._parsed_vars_cache: Tuple[str, List[str]] = ("", [])
+        # Incremented for every render request so results of superseded renders are dropped
+        self._latex_render_generation = 0
+        self._latex_render_task: Optional[_LatexRenderTask] = None
+        # matplotlib is not thread-safe, so renders run one at a time on a private pool
+        self._latex_render_pool = QThreadPool(self)
+        self._latex_render_pool.setMaxThreadCount(1)
+        # Coalesces the variable input rebuilds while the variable names are being typed
+        self._var_update_timer = QTimer(self)
+        self._var_update_timer.setSingleShot(True)
+        self._var_update_timer.setInterval(150)
+        self._var_update_timer.timeout.connect(self._update_variable_inputs)
         self._init_ui()
         self._connect_signals()
         self._update_ui_mode()  # Initialize UI based on default mode
@@ -147,7 +264,7 @@ class UncertaintyCalculatorDialog(QDialog):
         """
         Connect signals to slots.
         """
-        self.variables_input.textChanged.connect(self._update_variable_inputs)
+        self.variables_input.textChanged.connect(self._var_update_timer.start)
         self.calculate_radio.toggled.connect(self._update_ui_mode)
         self.calculate_button.clicked.connect(self._calculate_uncertainty_result)
         self.propagate_button.clicked.connect(self._generate_latex_formula)
@@ -165,74 +282,99 @@ class UncertaintyCalculatorDialog(QDialog):
             self._update_variable_inputs()
         self.adjustSize()
 
+    def _parsed_variables(self) -> List[str]:
+        """
+        Returns the variable names entered in variables_input, reparsing only when the text changed.
+        The returned list is shared and must not be modified.
+        """
+        text = self.variables_input.text()
+        cached_text, cached_variables = self._parsed_vars_cache
+        if text == cached_text:
+            return cached_variables
+        variables = _VAR_TOKEN_RE.findall(text)
+        self._parsed_vars_cache = (text, variables)
+        return variables
+
     def _update_variable_inputs(self) -> None:
         """
         Dynamically create/update input fields for variables based on the variables_input.
         """
-        variables_text = self.variables_input.text()
-        variables = [v.strip() for v in variables_text.split(",") if v.strip()]
+        variables = self._parsed_variables()
 
         if variables == self._current_variables:
             return
 
         self._current_variables = variables
 
-        # Clear existing inputs and reset stored references
-        while self.dynamic_variables_layout.count():
-            item = self.dynamic_variables_layout.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
-                else:
-                    layout = item.layout()
-                    if layout is not None:
-                        while layout.count():
-                            child_item = layout.takeAt(0)
-                            if child_item is not None:
-                                child_widget = child_item.widget()
-                                if child_widget is not None:
-                                    child_widget.deleteLater()
-        self.variable_inputs = {}
-
         if self.calculate_radio.isChecked():
             self.dynamic_variables_group.setTitle("Variable Values and Uncertainties")
-            for var in variables:
-                value_input = QLineEdit()
-                value_input.setPlaceholderText(f"Value of {var}")
-
-                uncertainty_input = QLineEdit()
-                uncertainty_input.setPlaceholderText(f"Uncertainty of {var}")
-
-                # Store references to the input fields
-                self.variable_inputs[var] = (value_input, uncertainty_input)
-
-                h_layout = QHBoxLayout()
-                h_layout.addWidget(QLabel(f"{var}:"))
-                h_layout.addWidget(QLabel("Value:"))
-                h_layout.addWidget(value_input)
-                h_layout.addWidget(QLabel("Uncertainty:"))
-                h_layout.addWidget(uncertainty_input)
-                self.dynamic_variables_layout.addRow(h_layout)
+            self._sync_variable_rows(list(dict.fromkeys(variables)))
         else:
             self.dynamic_variables_group.setTitle("Variables for Propagation")
             # No dynamic inputs needed for propagate mode, just clear them
+            self._sync_variable_rows([])
         self.adjustSize()
 
-    def _get_variable_data(self) -> Dict[str, Tuple[float, float]]:
+    def _sync_variable_rows(self, variables: List[str]) -> None:
         """
-        Retrieves variable values and uncertainties from dynamic input fields.
+        Adds and removes variable input rows to match variables, keeping the rows (and any
+        entered values) of variables that are still listed.
         """
-        variables_data: Dict[str, Tuple[float, float]] = {}
-        variables_text = self.variables_input.text()
-        variables = [v.strip() for v in variables_text.split(",") if v.strip()]
+        # Rows follow the order of self.variable_inputs; drop the unlisted ones bottom-up
+        for row, var in reversed(list(enumerate(self.variable_inputs))):
+            if var not in variables:
+                self.dynamic_variables_layout.removeRow(row)
+                del self.variable_inputs[var]
+
+        # Fill the rows top-down: each position either gets its existing row moved up from
+        # further down (keeping its widgets and values) or a new row
+        layout = self.dynamic_variables_layout
+        row_order = list(self.variable_inputs)
+        inputs: Dict[str, Tuple[QLineEdit, QLineEdit]] = {}
+        for row, var in enumerate(variables):
+            existing = self.variable_inputs.get(var)
+            if existing is None:
+                inputs[var] = self._insert_variable_row(row, var)
+                row_order.insert(row, var)
+                continue
+            current_row = row_order.index(var)
+            if current_row != row:
+                taken = layout.takeRow(current_row)
+                layout.insertRow(row, taken.fieldItem.layout())
+                row_order.insert(row, row_order.pop(current_row))
+            inputs[var] = existing
+        self.variable_inputs = inputs
+
+    def _insert_variable_row(self, row: int, var: str) -> Tuple[QLineEdit, QLineEdit]:
+        """
+        Inserts the value and uncertainty inputs for a variable at the given row.
+        """
+        value_input = QLineEdit()
+        value_input.setPlaceholderText(f"Value of {var}")
 
-        for var in variables:
-            if var not in self.variable_inputs:
-                raise ValueError(f"Input fields for variable '{var}' not found. This should not happen.")
+        uncertainty_input = QLineEdit()
+        uncertainty_input.setPlaceholderText(f"Uncertainty of {var}")
 
-            value_input, uncertainty_input = self.variable_inputs[var]
+        h_layout = QHBoxLayout()
+        h_layout.addWidget(QLabel(f"{var}:"))
+        h_layout.addWidget(QLabel("Value:"))
+        h_layout.addWidget(value_input)
+        h_layout.addWidget(QLabel("Uncertainty:"))
+        h_layout.addWidget(uncertainty_input)
+        self.dynamic_variables_layout.insertRow(row, h_layout)
+        return value_input, uncertainty_input
 
+    def _get_variable_data(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Retrieves variable values and uncertainties from dynamic input fields.
+        """
+        # Apply a pending variable change so the input fields match the variables text
+        if self._var_update_timer.isActive():
+            self._var_update_timer.stop()
+            self._update_variable_inputs()
+
+        variables_data: Dict[str, Tuple[float, float]] = {}
+        for var, (value_input, uncertainty_input) in self.variable_inputs.items():
             try:
                 value = float(value_input.text())
                 uncertainty = float(uncertainty_input.text())
@@ -270,13 +412,16 @@ class UncertaintyCalculatorDialog(QDialog):
         """
         Generates the LaTeX uncertainty propagation formula.
         """
+        # Apply a pending variable change before reading the inputs
+        self._var_update_timer.stop()
+        self._update_variable_inputs()
+
         formula = self.formula_input.text().strip()
         if not formula:
             QMessageBox.warning(self, "Input Error", "Please enter a formula.")
             return
 
-        variables_text = self.variables_input.text()
-        variables = [v.strip() for v in variables_text.split(",") if v.strip()]
+        variables = self._parsed_variables()
         if not variables:
             QMessageBox.warning(self, "Input Error", "Please enter variable names.")
             return
@@ -292,62 +437,73 @@ class UncertaintyCalculatorDialog(QDialog):
             palette = self.palette()
             bg_color = palette.color(palette.ColorRole.Window).name()
             fg_color = palette.color(palette.ColorRole.WindowText).name()
-
-            pixmap, error = self._render_latex(latex_formula, fg_color, bg_color)
-            if pixmap:
-                self.rendered_latex_label.setPixmap(pixmap)
-                horizontal_scroll_bar = self.scroll_area.horizontalScrollBar()
-                scroll_bar_height = horizontal_scroll_bar.height() if horizontal_scroll_bar is not None else 0
-                self.scroll_area.setMinimumHeight(pixmap.height() + scroll_bar_height)
-            else:
-                if error == "renderer_not_found":
-                    error_message = "<i>Error rendering LaTeX: LaTeX renderer not found.</i><br>"
-                    error_message += "Please install a LaTeX distribution like "
-                    error_message += (
-                        '<a href="https://miktex.org/download">MiKTeX</a> and ensure it is in your system\'s PATH.'
-                    )
-                else:
-                    error_message = f"<i>Error rendering LaTeX:</i><br><pre>{error}</pre>"
-                self.rendered_latex_label.setText(error_message)
-            self.adjustSize()
+            self._request_latex_render(latex_formula, fg_color, bg_color)
         except ValueError as e:
             QMessageBox.critical(self, "Formula Generation Error", f"ValueError: {str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "An Error Occurred", f"Unexpected error: {e}\n\nType: {type(e).__name__}")
 
-    def _render_latex(self, latex: str, fg_color: str, bg_color: str) -> Tuple[Optional[QPixmap], Optional[str]]:
+    def _request_latex_render(self, latex: str, fg_color: str, bg_color: str) -> None:
         """
-        Renders a LaTeX string into a QPixmap.
+        Shows the rendered formula, rendering it on a worker thread unless it is cached.
         """
-        try:
-            buffer = BytesIO()
-            plt.rc("text", usetex=True)
-            plt.rc("font", family="serif")
-            plt.rc("text.latex", preamble=r"\usepackage{amsmath}")
-
-            font_size = 30 * self.logicalDpiX() / 96.0
-            fig = plt.figure(facecolor=bg_color)
-            text = fig.text(0, 0, f"${latex}$", ha="center", va="center", color=fg_color, fontsize=font_size)
-
-            # Dynamically adjust font size
-            canvas_agg = cast(FigureCanvasAgg, fig.canvas)
-            renderer = canvas_agg.get_renderer()
-            bbox = text.get_window_extent(renderer=renderer)
-
-            fig.set_size_inches(bbox.width / fig.dpi, bbox.height / fig.dpi)
-
-            plt.axis("off")
-            fig.savefig(buffer, format="png", bbox_inches="tight", pad_inches=0, facecolor=bg_color)
-            plt.close(fig)
-
-            buffer.seek(0)
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.read())
-            return pixmap, None
-        except FileNotFoundError:
-            return None, "renderer_not_found"
-        except RuntimeError as e:
-            return None, str(e)
+        self._latex_render_generation += 1
+        key = (latex, fg_color, bg_color, round(self.logicalDpiX()))
+        png_bytes = _LATEX_PNG_CACHE.get(key)
+        if png_bytes is not None:
+            _LATEX_PNG_CACHE.move_to_end(key)
+            self._show_rendered_latex(png_bytes)
+            return
+
+        self.rendered_latex_label.setText("<i>Rendering…</i>")
+        self.adjustSize()
+        task = _LatexRenderTask(self._latex_render_generation, key, self.logicalDpiX())
+        task.signals.finished.connect(self._on_latex_rendered)
+        self._latex_render_task = task
+        self._latex_render_pool.start(task)
+
+    def _on_latex_rendered(self, generation: int, key: Tuple[str, str, str, int], png_bytes: bytes, error: str) -> None:
+        """
+        Receives a finished render on the GUI thread.
+        """
+        if png_bytes:
+            _LATEX_PNG_CACHE[key] = png_bytes
+            if len(_LATEX_PNG_CACHE) > _LATEX_PNG_CACHE_SIZE:
+                _LATEX_PNG_CACHE.popitem(last=False)
+
+        if generation != self._latex_render_generation:
+            return  # A newer formula was requested meanwhile
+        self._latex_render_task = None
+
+        if png_bytes:
+            self._show_rendered_latex(png_bytes)
+        else:
+            self._show_latex_error(error)
+
+    def _show_rendered_latex(self, png_bytes: bytes) -> None:
+        """
+        Displays a rendered formula and sizes the scroll area to fit it.
+        """
+        pixmap = QPixmap()
+        pixmap.loadFromData(png_bytes)
+        self.rendered_latex_label.setPixmap(pixmap)
+        horizontal_scroll_bar = self.scroll_area.horizontalScrollBar()
+        scroll_bar_height = horizontal_scroll_bar.height() if horizontal_scroll_bar is not None else 0
+        self.scroll_area.setMinimumHeight(pixmap.height() + scroll_bar_height)
+        self.adjustSize()
+
+    def _show_latex_error(self, error: str) -> None:
+        """
+        Displays why a formula could not be rendered.
+        """
+        if error == "renderer_not_found":
+            error_message = "<i>Error rendering LaTeX: LaTeX renderer not found.</i><br>"
+            error_message += "Please install a LaTeX distribution like "
+            error_message += '<a href="https://miktex.org/download">MiKTeX</a> and ensure it is in your system\'s PATH.'
+        else:
+            error_message = f"<i>Error rendering LaTeX:</i><br><pre>{error}</pre>"
+        self.rendered_latex_label.setText(error_message)
+        self.adjustSize()
 
 
 # Example of how to use it (for testing purposes)
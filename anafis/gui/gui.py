@@ -7,6 +7,7 @@ the notebook for tabs, and other main GUI components.
 
 import sys
 import logging
+from functools import cache
 from typing import Optional
 from pathlib import Path
 
@@ -14,9 +15,45 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTranslator
 from PyQt6.QtGui import QIcon
 
-from anafis import __version__
+from anafis import get_version
 from anafis.core.config import ApplicationConfig
-from anafis.gui.shell.notebook import Notebook
+from anafis.core.data_structures import Language, Theme
+
+_ICON_PATH = "anafis/assets/icon.png"
+
+# Decoded application icon, loaded on first use
+_app_icon: Optional[QIcon] = None
+
+
+def get_app_icon() -> Optional[QIcon]:
+    """
+    Get the application icon, loading it on first use.
+
+    Returns:
+        The cached QIcon, or None if the icon file is missing
+    """
+    global _app_icon
+
+    if _app_icon is None and Path(_ICON_PATH).exists():
+        _app_icon = QIcon(_ICON_PATH)
+    return _app_icon
+
+
+@cache
+def _get_translator(locale: str) -> Optional[QTranslator]:
+    """
+    Get the translator for a locale, loading it on first use.
+
+    Args:
+        locale: Language code of the translation
+
+    Returns:
+        The loaded QTranslator, or None if no translation exists for the locale
+    """
+    translator = QTranslator()
+    if translator.load(f"anafis_{locale}", ":/translations/"):
+        return translator
+    return None
 
 
 def create_gui_application(logger: logging.Logger, config: ApplicationConfig) -> Optional[QApplication]:
@@ -41,49 +78,42 @@ def create_gui_application(logger: logging.Logger, config: ApplicationConfig) ->
         app.setOrganizationName("ANAFIS Development Team")
         app.setOrganizationDomain("anafis.org")
 
-        # Set up internationalization
-        translator = QTranslator()
         locale = config.general.language.value
-        if translator.load(f"anafis_{locale}", ":/translations/"):
-            app.installTranslator(translator)
-            logger.info(f"Loaded translation for locale: {locale}")
-        else:
-            logger.warning(f"Could not load translation for locale: {locale}")
+        theme = config.general.theme.value
+
+        # Set up internationalization; English is the source language and needs no translator
+        if locale != Language.ENGLISH.value:
+            translator = _get_translator(locale)
+            if translator is not None:
+                app.installTranslator(translator)
+                logger.info("Loaded translation for locale: %s", locale)
+            else:
+                logger.warning("Could not load translation for locale: %s", locale)
 
         # Set application icon
-        icon_path = "anafis/assets/icon.png"
-        if Path(icon_path).exists():
-            app.setWindowIcon(QIcon(icon_path))
+        icon = get_app_icon()
+        if icon is not None:
+            app.setWindowIcon(icon)
         else:
-            logger.warning(f"Application icon not found at: {icon_path}")
+            logger.warning("Application icon not found at: %s", _ICON_PATH)
 
         # Apply theme settings
-        if config.general.theme.value != "system":
-            logger.info(f"Applying theme: {config.general.theme.value}")
+        if theme != Theme.SYSTEM.value:
+            logger.info("Applying theme: %s", theme)
             # Theme application will be implemented in later tasks
 
         logger.info("GUI application created successfully")
         return app
 
     except ImportError as e:
-        logger.error(f"Failed to import GUI libraries: {e}")
+        logger.error("Failed to import GUI libraries: %s", e)
         logger.error("Please ensure PyQt6 is installed")
         return None
     except Exception as e:
-        logger.error(f"Failed to create GUI application: {e}")
+        logger.error("Failed to create GUI application: %s", e)
         return None
 
 
-def get_version() -> str:
-    """
-    Get the application version.
-
-    Returns:
-        Version string
-    """
-    return __version__
-
-
 def run_application(app: Optional[QApplication], logger: logging.Logger, config: ApplicationConfig) -> int:
     """
     Run the main application.
@@ -101,6 +131,9 @@ def run_application(app: Optional[QApplication], logger: logging.Logger, config:
         logger.info("Application would start here (GUI not implemented yet)")
         return 0
 
+    # Deferred: the notebook pulls in every tab module (and matplotlib/numpy)
+    from anafis.gui.shell.notebook import Notebook
+
     main_window = None
     try:
         logger.info("Starting GUI application")
@@ -110,8 +143,9 @@ def run_application(app: Optional[QApplication], logger: logging.Logger, config:
         return app.exec()
 
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         return 1
     finally:
         if main_window:
             main_window.save_session()
+            main_window.wait_for_session_save()
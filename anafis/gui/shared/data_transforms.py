@@ -10,6 +10,11 @@ from datetime import datetime
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+except ImportError:  # Optional; DataFrames fall back to a record list
+    pa = None  # type: ignore[assignment]
+
 from anafis.core.data_structures import (
     DataPayload,
     SerializedDataFrame,
@@ -69,6 +74,10 @@ def deserialize_numpy_array(data: SerializedNumpyArray) -> np.ndarray:
     if data.get("type") != "numpy_array":
         raise ValueError("Data is not a serialized numpy array")
 
+    if "buffer" in data:
+        # Copy so the receiver gets a writable array that does not share the message's bytes
+        return np.frombuffer(data["buffer"], dtype=data["dtype"]).reshape(data["shape"]).copy()
+
     arr = np.array(data["data"])
 
     # Restore dtype if possible
@@ -88,27 +97,58 @@ def deserialize_numpy_array(data: SerializedNumpyArray) -> np.ndarray:
     return arr
 
 
+def _dataframe_to_ipc(df: pd.DataFrame) -> Optional[bytes]:
+    """Encode a DataFrame as an Arrow IPC stream, or return None if Arrow cannot represent it."""
+    # Arrow tables need unique column names
+    if pa is None or not df.columns.is_unique:
+        return None
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # e.g. object columns mixing numbers and strings
+        return None
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return cast(bytes, sink.getvalue().to_pybytes())
+
+
 def serialize_dataframe(df: pd.DataFrame) -> SerializedDataFrame:
     """
     Serialize a pandas DataFrame for data bus transmission.
 
+    The frame is sent as an Arrow IPC stream when pyarrow is available, which
+    preserves dtypes and the index exactly; otherwise it is sent as records.
+
     Args:
         df: DataFrame to serialize
 
     Returns:
         Serialized DataFrame data
     """
-    return {
+    serialized: SerializedDataFrame = {
         "type": "dataframe",
-        "data": cast(List[Dict[str, Union[str, int, float, bool, None]]], df.to_dict(orient="records")),
         "columns": list(df.columns),
         "dtypes": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
-        "index": df.index.tolist(),
         "shape": df.shape,
     }
 
+    ipc_bytes = _dataframe_to_ipc(df)
+    if ipc_bytes is not None:
+        serialized["ipc_bytes"] = ipc_bytes
+    else:
+        serialized["data"] = cast(List[Dict[str, Union[str, int, float, bool, None]]], df.to_dict(orient="records"))
+        serialized["index"] = df.index.tolist()
+    return serialized
+
 
 def deserialize_dataframe(data: SerializedDataFrame) -> pd.DataFrame:
+    if "ipc_bytes" in data:
+        if pa is None:
+            raise ValueError("pyarrow is required to read an Arrow-encoded DataFrame")
+        return pa.ipc.open_stream(data["ipc_bytes"]).read_all().to_pandas()
+
     df = pd.DataFrame(data["data"])
 
     # Restore column order
@@ -139,18 +179,25 @@ def serialize_numpy_array(arr: np.ndarray) -> SerializedNumpyArray:
     """
     Serialize a numpy array for data bus transmission.
 
+    Arrays with a fixed-size dtype are sent as their raw buffer; object arrays
+    are sent as nested lists.
+
     Args:
         arr: NumPy array to serialize
 
     Returns:
         Serialized array data
     """
-    return {
+    serialized: SerializedNumpyArray = {
         "type": "numpy_array",
-        "data": arr.tolist(),
         "dtype": str(arr.dtype),
         "shape": arr.shape,
     }
+    if arr.dtype.hasobject:
+        serialized["data"] = arr.tolist()
+    else:
+        serialized["buffer"] = np.ascontiguousarray(arr).tobytes()
+    return serialized
 
 
 def transform_spreadsheet_to_fitting(
@@ -224,7 +271,7 @@ def transform_montecarlo_to_fitting(
 
     if isinstance(sim_data_raw, pd.DataFrame):
         df = sim_data_raw
-    elif isinstance(sim_data_raw, dict) and "data" in sim_data_raw:
+    elif isinstance(sim_data_raw, dict) and sim_data_raw.get("type") == "dataframe":
         # Here, sim_data_raw is a dict that matches SerializedDataFrame structure
         df = deserialize_dataframe(sim_data_raw)
     else:
@@ -25,6 +25,7 @@ from anafis.gui.shell.drag_and_drop.drop_indicator import DropIndicator
 from anafis.gui.shell.drag_and_drop.drag_state import DragState, DragOperation
 from anafis.gui.shell.drag_and_drop.global_drag_manager import GlobalDragManager
 from anafis.gui.shell.drag_and_drop.window_hierarchy import window_hierarchy, WindowHierarchy
+from anafis.core.protocols import HasGetState
 
 # For new tab creation in detached windows
 from anafis.gui.tabs.spreadsheet_tab import SpreadsheetTab
@@ -782,7 +783,7 @@ class DetachableTabWidget(QTabWidget):
 
         for i in range(self.count()):
             widget = self.widget(i)
-            if widget is not None and hasattr(widget, "get_state"):
+            if isinstance(widget, HasGetState):
                 tab_state = widget.get_state()
                 cast(List[Dict], main_state["tabs"]).append(tab_state)  # Cast to List[Dict]
 
@@ -792,7 +793,7 @@ class DetachableTabWidget(QTabWidget):
         for window in self.detached_windows:
             # Assuming DetachedWindow has a method to get its state
             # This needs to be implemented in DetachedWindow if not already
-            if hasattr(window, "get_state"):  # Placeholder, needs actual implementation
+            if isinstance(window, HasGetState):  # Placeholder, needs actual implementation
                 states.append(cast(Dict, window.get_state()))  # Cast to Dict
 
         return states
@@ -1,6 +1,5 @@
 import json
 import logging
-from pathlib import Path
 from typing import Dict, List, Optional, TYPE_CHECKING, Callable, cast
 from datetime import datetime
 
@@ -10,6 +9,7 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget
 )
 
+from anafis.core.logging_config import SESSION_FILE
 from anafis.core.protocols import HasGetState
 
 # Avoid circular imports for type hinting
@@ -125,7 +125,7 @@ class WindowHierarchy(QObject):
             }
 
             # Ensure logs directory exists
-            session_file = Path(".logs") / "complete_session.json"
+            session_file = SESSION_FILE
             session_file.parent.mkdir(exist_ok=True)
 
             with open(session_file, "w") as f:
@@ -1,6 +1,7 @@
 import json
 import logging
-from pathlib import Path
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Union, List, Dict, cast, TypedDict, Optional
 from datetime import datetime
 
@@ -20,11 +21,17 @@ from anafis.gui.dialogs.uncertainty_calculator_dialog import UncertaintyCalculat
 from anafis.gui.shared.data_bus import get_global_data_bus
 
 from anafis.core.data_structures import TabState, ApplicationConfig
-from anafis.core.protocols import HasGetState
+from anafis.core.logging_config import SESSION_FILE
+from anafis.core.protocols import HasGetState, HasSetTabName
 
 # Import new window hierarchy and session management
 from anafis.gui.shell.drag_and_drop.window_hierarchy import window_hierarchy
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None  # type: ignore[assignment]
+
 
 class WindowState(TypedDict):
     window_type: str
@@ -39,12 +46,37 @@ class DetachedWindowState(WindowState):
 logger = logging.getLogger(__name__)
 
 
+def _tab_type_label(tab_type: str) -> str:
+    """Returns the default title of a tab type."""
+    return tab_type.capitalize()
+
+
+def _restored_tab_title(tab_state: Dict) -> str:
+    """Returns the saved tab name, falling back to the label of the tab type."""
+    tab_name = tab_state.get("tab_name")
+    if tab_name is not None:
+        return str(tab_name)
+    tab_type = tab_state.get("type")
+    if tab_type is None:
+        return ""
+    return _tab_type_label(tab_type)
+
+
 class SessionManager:
     """Enhanced session management with multi-window support"""
 
+    # Single background writer so consecutive saves land on disk in order
+    _writer: Optional[ThreadPoolExecutor] = None
+    _pending_write: Optional["Future[None]"] = None
+
     @staticmethod
     def save_session(notebook: "Notebook") -> None:
-        """Save complete session including all windows"""
+        """Save complete session including all windows
+
+        Widget state is collected on the calling (GUI) thread; encoding and
+        writing the file happen on a background thread. Use
+        wait_for_pending_save() to block until the file is on disk.
+        """
         session_data = {
             "version": __version__,
             "timestamp": datetime.now().isoformat(),
@@ -53,11 +85,32 @@ class SessionManager:
             "application_config": SessionManager._get_app_config_state(notebook),
         }
 
-        session_file = Path(".logs") / "complete_session.json"
+        if SessionManager._writer is None:
+            SessionManager._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anafis-session")
+        SessionManager._pending_write = SessionManager._writer.submit(SessionManager._write_session_file, session_data)
+
+    @staticmethod
+    def wait_for_pending_save() -> None:
+        """Block until the most recently requested session save has been written"""
+        pending = SessionManager._pending_write
+        if pending is not None:
+            pending.result()
+
+    @staticmethod
+    def _write_session_file(session_data: Dict) -> None:
+        """Encode the session and atomically replace the session file"""
+        session_file = SESSION_FILE
         try:
             session_file.parent.mkdir(exist_ok=True)
-            with open(session_file, "w") as f:
-                json.dump(session_data, f, indent=4, default=str)
+            if orjson is not None:
+                payload = orjson.dumps(session_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(session_data, indent=4, default=str).encode("utf-8")
+
+            # Write next to the target and rename so a crash never leaves a truncated session
+            temp_file = session_file.with_suffix(".json.tmp")
+            temp_file.write_bytes(payload)
+            os.replace(temp_file, session_file)
 
             logger.info(f"Complete session saved: {len(session_data['detached_windows']) + 1} windows")
 
@@ -67,15 +120,18 @@ class SessionManager:
     @staticmethod
     def load_session(notebook: "Notebook") -> bool:
         """Load complete session including all windows"""
-        session_file = Path(".logs") / "complete_session.json"
+        session_file = SESSION_FILE
 
         if not session_file.exists():
             logger.info("No complete session file found")
             return False
 
         try:
-            with open(session_file, "r") as f:
-                session_data = json.load(f)
+            if orjson is not None:
+                session_data = orjson.loads(session_file.read_bytes())
+            else:
+                with open(session_file, "r") as f:
+                    session_data = json.load(f)
 
             # Validate session version
             version = session_data.get("version", "1.0")
@@ -110,11 +166,11 @@ class SessionManager:
     def _get_main_window_state(notebook: "Notebook") -> WindowState:
         """Get main window state"""
         tabs: List[TabState] = []
-        for i in range(notebook.tabs.count()):
-            widget = notebook.tabs.widget(i)
+        tab_widget = notebook.tabs
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
             if isinstance(widget, HasGetState):
-                tab_state = widget.get_state()
-                tabs.append(tab_state)
+                tabs.append(widget.get_state())
 
         return {
             "window_type": "main",
@@ -129,8 +185,9 @@ class SessionManager:
 
         for window in notebook.tabs.detached_windows:
             tabs: List[TabState] = []
-            for i in range(window.internal_tab_widget.count()):
-                widget = window.internal_tab_widget.widget(i)
+            internal_tabs = window.internal_tab_widget
+            for i in range(internal_tabs.count()):
+                widget = internal_tabs.widget(i)
                 if isinstance(widget, HasGetState):
                     tab_state = widget.get_state()
                     tab_state["detached"] = True
@@ -163,8 +220,19 @@ class SessionManager:
         notebook.tabs.close_all_detached_windows()
 
         # Clear main window tabs (except Home)
-        while notebook.tabs.count() > 1:
-            notebook.tabs.removeTab(1)
+        SessionManager._remove_non_home_tabs(notebook)
+
+    @staticmethod
+    def _remove_non_home_tabs(notebook: "Notebook") -> None:
+        """Remove every tab but Home, emitting signals and relayouting only once"""
+        tabs = notebook.tabs
+        tabs.blockSignals(True)
+        try:
+            for index in range(tabs.count() - 1, 0, -1):
+                tabs.removeTab(index)
+        finally:
+            tabs.blockSignals(False)
+            tabs.update()
 
     @staticmethod
     def _restore_main_window(notebook: "Notebook", main_window_data: Dict) -> None:
@@ -184,8 +252,7 @@ class SessionManager:
                 try:
                     tab_widget = notebook.create_tab_from_state(cast(TabState, tab_state))  # Cast to TabState
                     if tab_widget:
-                        tab_type = tab_state.get("type")
-                        tab_title = tab_state.get("tab_name", tab_type.capitalize() if tab_type is not None else "")
+                        tab_title = _restored_tab_title(tab_state)
                         notebook.tabs.addTab(tab_widget, tab_title)
                 except Exception as e:
                     logger.error(f"Error restoring tab: {e}")
@@ -211,8 +278,7 @@ class SessionManager:
                 for tab_state in tabs_data:
                     tab_widget = notebook.create_tab_from_state(cast(TabState, tab_state))  # Cast to TabState
                     if tab_widget:
-                        tab_type = tab_state.get("type")
-                        tab_title = tab_state.get("tab_name", tab_type.capitalize() if tab_type is not None else "")
+                        tab_title = _restored_tab_title(tab_state)
                         widgets_and_titles.append((tab_widget, tab_title))
 
                 if widgets_and_titles:
@@ -257,15 +323,13 @@ class SessionManager:
         logger.info("Loading legacy session...")
         try:
             # Clear existing tabs (except Home)
-            while notebook.tabs.count() > 1:
-                notebook.tabs.removeTab(1)
+            SessionManager._remove_non_home_tabs(notebook)
 
             for tab_state in session_data:
                 if tab_state.get("type") != "home":
                     tab_widget = notebook.create_tab_from_state(cast(TabState, tab_state))  # Cast to TabState
                     if tab_widget:
-                        tab_type = tab_state.get("type")
-                        tab_title = tab_state.get("tab_name", tab_type.capitalize() if tab_type is not None else "")
+                        tab_title = _restored_tab_title(tab_state)
                         notebook.tabs.addTab(
                             tab_widget,
                             tab_title,
@@ -366,11 +430,11 @@ class Notebook(QMainWindow):
 
     def _handle_tab_renamed(self, index: int, new_name: str) -> None:
         widget = self.tabs.widget(index)
-        if widget is not None and hasattr(widget, "set_tab_name"):
+        if isinstance(widget, HasSetTabName):
             widget.set_tab_name(new_name)
 
         # Update the tab's state in the session data if it's a persistent tab
-        if widget is not None and isinstance(widget, HasGetState):
+        if isinstance(widget, HasGetState):
             state = widget.get_state()
             state["tab_name"] = new_name
 
@@ -387,7 +451,7 @@ class Notebook(QMainWindow):
         self._tab_id_counter += 1
 
         # Create widget with tab_id for data bus enabled tabs
-        tab_title = f"{tab_type.capitalize()} {self._tab_id_counter}"
+        tab_title = f"{_tab_type_label(tab_type)} {self._tab_id_counter}"
         widget: Optional[Union[SpreadsheetTab, FittingTab, SolverTab, MonteCarloTab]] = None
         if tab_type == "spreadsheet":
             widget = SpreadsheetTab(tab_id=tab_id, parent=self, tab_name=tab_title)
@@ -444,9 +508,10 @@ class Notebook(QMainWindow):
         states: List[TabState] = []
 
         # Get states from main tab widget
-        for i in range(self.tabs.count()):
-            widget = self.tabs.widget(i)
-            if widget is not None and isinstance(widget, HasGetState):
+        tab_widget = self.tabs
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
+            if isinstance(widget, HasGetState):
                 state = widget.get_state()
                 if state.get("type") != "home":  # Skip home tab
                     states.append(state)
@@ -458,6 +523,10 @@ class Notebook(QMainWindow):
         """Saves the current session to a file."""
         self.session_manager.save_session(self)
 
+    def wait_for_session_save(self) -> None:
+        """Blocks until any in-flight session save has been written to disk."""
+        self.session_manager.wait_for_pending_save()
+
     def load_session(self) -> None:
         """Loads a session from a file."""
         self.session_manager.load_session(self)
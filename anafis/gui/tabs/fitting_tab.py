@@ -3,7 +3,7 @@ Fitting tab implementation with data bus integration.
 """
 
 import logging
-from typing import Optional, cast
+from typing import Dict, Optional, cast
 import pandas as pd
 from PyQt6.QtWidgets import (
     QWidget,
@@ -22,6 +22,7 @@ from PyQt6.QtCore import pyqtSlot
 from anafis.gui.shared.base_tab import DataBusEnabledTab, FittingTabMixin
 from anafis.gui.shared.data_transforms import deserialize_dataframe
 from anafis.core.data_structures import (
+    JSON_VALUE,
     TabState,
     DataPayload,
     FittingParameters,
@@ -167,11 +168,11 @@ class FittingTab(DataBusEnabledTab, FittingTabMixin):
             results_text = f"""Fitting Results:
 
 Model: {model_type.title()}
-Equation: {self.fitting_results['equation']}
-R² = {self.fitting_results['r_squared']:.4f}
-RMSE = {self.fitting_results['rmse']:.4f}
-Iterations: {self.fitting_results['iterations_used']}
-Converged: {self.fitting_results['converged']}
+Equation: {self.fitting_results.equation}
+R² = {self.fitting_results.r_squared:.4f}
+RMSE = {self.fitting_results.rmse:.4f}
+Iterations: {self.fitting_results.iterations_used}
+Converged: {self.fitting_results.converged}
 
 Parameters used:
 - Max iterations: {max_iter}
@@ -197,10 +198,10 @@ Parameters used:
 
         success = self.publish_data(
             data_type="fitting_results",
-            data=self.fitting_results,
+            data=self.fitting_results.to_dict(),
             metadata={
                 "source_tab": self.tab_id,
-                "model_type": self.fitting_results["model_type"],
+                "model_type": self.fitting_results.model_type,
             },
         )
 
@@ -305,9 +306,11 @@ Parameters used:
         except (ValueError, TypeError) as e:
             logger.warning(f"Error applying parameters in fitting tab: {e}")
 
-    def get_exportable_data(self) -> Optional[FittingResults]:
+    def get_exportable_data(self) -> Optional[Dict[str, JSON_VALUE]]:
         """Get data that can be exported to other tabs."""
-        return self.fitting_results
+        if self.fitting_results is None:
+            return None
+        return self.fitting_results.to_dict()
 
     def get_state(self) -> TabState:
         """Get current state for persistence."""
@@ -3,6 +3,7 @@ Spreadsheet tab implementation with data bus integration.
 """
 
 import logging
+from dataclasses import replace
 from typing import Optional, cast
 import pandas as pd
 from PyQt6.QtWidgets import (
@@ -32,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 def update_spreadsheet_data(state: SpreadsheetState, new_data: pd.DataFrame) -> SpreadsheetState:
     """Pure function to update the spreadsheet state with new data."""
-    return state._replace(data=new_data)
+    return replace(state, data=new_data)
 
 
 class SpreadsheetTab(DataBusEnabledTab, SpreadsheetTabMixin):